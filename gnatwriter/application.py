@@ -4,13 +4,28 @@ from datetime import datetime
 from typing import Type
 
 import bcrypt
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, event
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import Session
 from gnatwriter.controllers import ActivityController, AuthorController, BibliographyController, ChapterController, \
     CharacterController, EventController, ImageController, LinkController, AssistantController, \
     LocationController, NoteController, SceneController, StoryController, SubmissionController, UserController, \
     OllamaModelController, ExportController
-from gnatwriter.models import Base, User
+from gnatwriter.models import Base, User, Story, load_all_models
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Put each new SQLite connection in WAL mode with NORMAL sync
+
+    With a write-ahead log, commits append to the log instead of rewriting
+    the rollback journal, and NORMAL only syncs at checkpoints; a crash can
+    lose the last transactions but cannot corrupt the database.
+    """
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
 
 
 def hash_password(password: str) -> str:
@@ -31,7 +46,12 @@ def hash_password(password: str) -> str:
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
-    """Verify a password, return true if verified, false if not"""
+    """Verify a password, return true if verified, false if not
+
+    bcrypt.checkpw re-hashes the candidate with the stored salt and compares
+    the two digests in constant time, so no plain string comparison of
+    hashes should be added here.
+    """
 
     return bcrypt.checkpw(
         password.encode('utf8'), hashed_password.encode('utf8')
@@ -64,12 +84,14 @@ class GnatWriter:
 
     Methods:
     --------
-    __new__(cls, path_to_config: str) -> GnatWriter
+    __new__(cls, path_to_config: str, pool_size: int) -> GnatWriter
         Enforce Singleton pattern
-    __init__(self, path_to_config: str)
+    __init__(self, path_to_config: str, pool_size: int)
         Initialize the application
-    __call__(self, *args, **kwargs) -> Controller
+    __call__(self, controller: str) -> Controller
         Return the controller requested
+    system_user -> User
+        The system user, loaded once when the application starts
     __str__(self) -> str
         Return a string representation of the application
     __repr__(self) -> str
@@ -84,7 +106,7 @@ class GnatWriter:
     database_type: str = None
     path_to_config: str = None
     
-    def __new__(cls, path_to_config: str):
+    def __new__(cls, path_to_config: str, pool_size: int = 25):
         """Enforce Singleton pattern"""
 
         if cls._instance is None:
@@ -92,7 +114,31 @@ class GnatWriter:
 
         return cls._instance
 
-    def __init__(self, path_to_config: str):
+    def __init__(self, path_to_config: str, pool_size: int = 25):
+        """Initialize the application
+
+        Server databases get a pre-pinged, recycled connection pool of
+        pool_size connections plus as many overflow connections; around 25
+        is where pooling stops paying off for PostgreSQL and MySQL under
+        high concurrency. A SQLite database file keeps the default pool, so
+        threads get connections of their own and can read concurrently in
+        WAL mode; an in-memory SQLite database shares a single connection.
+
+        Because the class is a singleton, Python runs __init__ again every
+        time GnatWriter(...) is called; the configuration is only read, and
+        the engine and controllers only built, the first time for a given
+        configuration file.
+
+        Parameters
+        ----------
+        path_to_config : str
+            The path to the configuration file
+        pool_size : int
+            The number of pooled connections for PostgreSQL and MySQL
+        """
+
+        if self._config is not None and self.path_to_config == path_to_config:
+            return
 
         self.path_to_config = path_to_config
         self._config = ConfigParser()
@@ -101,7 +147,18 @@ class GnatWriter:
 
         if self.database_type == "sqlite":
             database = self._config.get("default_database", "database")
-            self._engine = create_engine(f"sqlite:///{database}")
+
+            if database == ":memory:":
+                # every connection to :memory: opens a new, empty database
+                self._engine = create_engine(
+                    "sqlite://",
+                    connect_args={"check_same_thread": False},
+                    poolclass=StaticPool
+                )
+            else:
+                self._engine = create_engine(f"sqlite:///{database}")
+
+            event.listen(self._engine, "connect", _set_sqlite_pragmas)
         elif self.database_type == "postgresql":
             user = self._config.get("default_database", "user")
             password = self._config.get("default_database", "password")
@@ -109,7 +166,9 @@ class GnatWriter:
             port = self._config.get("default_database", "port")
             database = self._config.get("default_database", "database")
             self._engine = create_engine(
-                f"postgresql+psycopg://{user}:{password}@{host}:{port}/{database}"
+                f"postgresql+psycopg://{user}:{password}@{host}:{port}/{database}",
+                pool_size=pool_size, max_overflow=pool_size,
+                pool_pre_ping=True, pool_recycle=1800
             )
         elif self.database_type == "mysql":
             user = self._config.get("default_database", "user")
@@ -118,10 +177,17 @@ class GnatWriter:
             port = self._config.get("default_database", "port")
             database = self._config.get("default_database", "database")
             self._engine = create_engine(
-                f"mysql+mysqlconnector://{user}:{password}@{host}:{port}/{database}"
+                f"mysql+mysqlconnector://{user}:{password}@{host}:{port}/{database}",
+                pool_size=pool_size, max_overflow=pool_size,
+                pool_pre_ping=True, pool_recycle=1800
             )
 
+        load_all_models()
         Base.metadata.create_all(self._engine)
+
+        with self._engine.begin() as connection:
+            Story.create_search_index(connection)
+
         self._session = Session(bind=self._engine, expire_on_commit=False)
         self._owner = self._session.query(User).filter(
             User.username == "gnatwriter"
@@ -143,6 +209,7 @@ class GnatWriter:
             )
             self._session.add(user)
             self._session.commit()
+            self._owner = user
 
         self._controllers = {
             "activity": ActivityController(
@@ -198,8 +265,30 @@ class GnatWriter:
             )
         }
 
-    def __call__(self, *args, **kwargs):
-        return self._controllers[args[0]]
+    def __call__(self, controller: str):
+        """Return the controller requested
+
+        Controllers are built once in __init__, so this is a dictionary
+        lookup and there is no need to hoist calls out of loops.
+
+        Parameters
+        ----------
+        controller : str
+            The name of the controller, e.g. "story" or "chapter"
+
+        Returns
+        -------
+        BaseController
+            The controller instance
+        """
+
+        return self._controllers[controller]
+
+    @property
+    def system_user(self) -> Type[User]:
+        """The system user, loaded once when the application starts"""
+
+        return self._owner
 
     def __str__(self):
         return "GnatWriter Application"
@@ -1,21 +1,178 @@
+import asyncio
 import base64
+import hashlib
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
 import shutil
+import tempfile
 import uuid
 from configparser import ConfigParser
 from datetime import datetime
-from typing import Type, Optional, Union, List, Literal, Mapping, Any
+from typing import Type, Optional, Union, List, Literal, Mapping, Any, Iterator, Tuple
+import numpy
 from langchain_community.document_loaders.directory import DirectoryLoader
 from langchain_community.document_loaders.text import TextLoader
 from langchain_community.embeddings.ollama import OllamaEmbeddings
 from langchain_community.vectorstores.chroma import Chroma
+from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from ollama import Client, Message
+from ollama import AsyncClient, Client, Message
 from sqlalchemy.orm import Session
 from gnatwriter.controllers.BaseController import BaseController
 from gnatwriter.models import User, Assistance, Activity, OllamaModel
 
 
+def _estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a text at four characters per token
+
+    The tokenizers of the Ollama models are not available client side, so
+    this is used wherever texts are measured in tokens.
+    """
+
+    return len(text) // 4 + 1
+
+
+# Chroma searches its collections through an HNSW graph; these settings
+# build a denser graph and widen the search beyond the defaults so recall
+# holds up as the number of splits grows
+_RAG_HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64
+}
+_RAG_QUESTION = "Question: "
+_RAG_CONTEXT = "\n\nContext: "
+_RAG_SEPARATOR = "\n\n"
+# the most chat requests rag_chat_batch() has in flight at once
+_MAX_CHAT_WORKERS = 8
+
+
+def _rag_prompt(prompt: str, retrieved_docs: list) -> str:
+    """Format a question and the splits retrieved for it as a RAG prompt
+
+    The fragments are joined in a single pass instead of formatting the
+    context and then the prompt around it.
+    """
+
+    return "".join((
+        _RAG_QUESTION, prompt, _RAG_CONTEXT,
+        _RAG_SEPARATOR.join([doc.page_content for doc in retrieved_docs])
+    ))
+
+
+def _openai_response(content: str, usage: Any) -> Mapping[str, Any]:
+    """Shape an OpenAI chat completion like an Ollama chat response"""
+
+    return {
+        "message": {"role": "assistant", "content": content},
+        "done": True,
+        "prompt_eval_count": usage.prompt_tokens if usage else None,
+        "eval_count": usage.completion_tokens if usage else None
+    }
+
+
+class _BatchedEmbeddings(Embeddings):
+    """Embed documents on a thread pool through another embeddings model
+
+    OllamaEmbeddings sends one HTTP request per text, and this wrapper does
+    not change the number of requests. It splits the texts into batches of
+    at most max_tokens estimated tokens and hands each batch to a worker
+    thread, so the requests of different batches are in flight at the same
+    time. The vectors are returned in the order of the texts.
+    """
+
+    def __init__(
+        self, embeddings: Embeddings, max_tokens: int = 8192,
+        max_workers: int = 8
+    ):
+        self._embeddings = embeddings
+        self._max_tokens = max_tokens
+        self._max_workers = max_workers
+
+    def _batches(self, texts: List[str]) -> List[List[str]]:
+        batches = []
+        batch = []
+        batch_tokens = 0
+
+        for text in texts:
+            tokens = _estimate_tokens(text)
+
+            if batch and batch_tokens + tokens > self._max_tokens:
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+
+            batch.append(text)
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        batches = self._batches(texts)
+
+        if len(batches) < 2:
+            return self._embeddings.embed_documents(texts)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(batches))
+        ) as pool:
+            vectors = pool.map(self._embeddings.embed_documents, batches)
+
+            return [vector for batch in vectors for vector in batch]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embeddings.embed_query(text)
+
+
+class _SemanticCache:
+    """Results for earlier prompts, looked up by prompt embedding similarity
+
+    A prompt whose embedding has a cosine similarity of at least threshold
+    with a cached prompt gets that prompt's result, e.g. a chat response or
+    the documents retrieved for it. The oldest entries are dropped once
+    max_size is reached.
+    """
+
+    def __init__(self, threshold: float = 0.92, max_size: int = 1000):
+        self._threshold = threshold
+        self._max_size = max_size
+        self._vectors = numpy.empty((0, 0))
+        self._results = []
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> numpy.ndarray:
+        vector = numpy.asarray(vector, dtype=numpy.float32)
+        norm = numpy.linalg.norm(vector)
+
+        return vector / norm if norm else vector
+
+    def lookup(self, vector: List[float]) -> Optional[Any]:
+        if not self._results:
+            return None
+
+        scores = self._vectors @ self._normalize(vector)
+        best = int(numpy.argmax(scores))
+
+        return self._results[best] if scores[best] >= self._threshold else None
+
+    def insert(self, vector: List[float], result: Any) -> None:
+        vector = self._normalize(vector)
+
+        if not self._results or self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = vector.reshape(1, -1)
+            self._results = [result]
+            return
+
+        self._vectors = numpy.vstack((self._vectors, vector))[-self._max_size:]
+        self._results = (self._results + [result])[-self._max_size:]
+
+
 class AssistantController(BaseController):
     """Assistant Controller
 
@@ -25,14 +182,32 @@ class AssistantController(BaseController):
         The configuration parser.
     _session_uuid : str
         The UUID of the session.
-    _client : OllamaClient
+    _ollama_url : str
+        The URL of the Ollama server.
+    _client : Client
         The Ollama client to be used when making requests.
+    _async_client : AsyncClient
+        The Ollama client to be used when awaiting requests.
+    _openai_client : OpenAI
+        The client of an OpenAI-compatible chat server, if one is configured.
     _chat_model : str
         The model to be used when chatting.
     _chat_num_ctx : int
         The number of tokens to use as context for the model.
     _chat_keep_alive : Union[float, str]
         The duration to keep the model in memory.
+    _chat_cache_similarity : float
+        The cosine similarity at which a cached chat response is reused.
+    _chat_caches : dict
+        The semantic caches of chat responses, one per priming.
+    _retrieved_documents : OrderedDict
+        The documents last retrieved for each set of documents and question.
+    _retrieval_caches : dict
+        The semantic caches of retrieved documents, one per set of documents.
+    _rag_store_limit : int
+        The number of persisted RAG vector stores kept on disk.
+    _embedding_model : str
+        The model to be used when embedding documents and prompts.
     _generative_model : str
         The model to be used when generating text.
     _generative_num_ctx : int
@@ -51,6 +226,17 @@ class AssistantController(BaseController):
     Methods
     -------
     chat(
+        prompt: str,
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None,
+        cache: bool = False
+    )
+        Chat with the Chat Assistant.
+    stream_chat(
         prompt: str,
         temperature: Optional[float] = 0.5,
         seed: Optional[int] = None,
@@ -59,6 +245,17 @@ class AssistantController(BaseController):
         session_uuid: str = None,
         keep_alive: Optional[Union[float, str]] = None
     )
+        Chat with the Chat Assistant, yielding the response as it arrives.
+    achat(
+        prompt: str,
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None
+    )
+        Chat with the Chat Assistant without blocking the event loop.
     generate(
         prompt: str = None,
         temperature: Optional[float] = 0.5,
@@ -82,6 +279,18 @@ class AssistantController(BaseController):
         Describe the contents of an image using the Ollama API.
     get_by_session_uuid(session_uuid: str)
         Get all Assistance messages by session UUID.
+    rag_chat_batch(
+        prompts: List[str],
+        documents: List[str],
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None,
+        cache: bool = False
+    )
+        Ask several independent questions about the same documents.
     """
 
     _templates = {}
@@ -104,22 +313,75 @@ class AssistantController(BaseController):
                 Assistance.session_uuid == uuid4
             ).first()
 
-        ollama_url = self._config.read("ollama", "url")
-
-        self._client = Client(host=ollama_url)  # If I make this a string instead of a bytearray, the ollama code breaks
+        # One client of each kind per controller keeps the HTTP connection to
+        # Ollama alive across requests instead of reconnecting every time
+        self._ollama_url = self._config.get("ollama", "url")
+        self._client = Client(host=self._ollama_url)
+        self._async_client = AsyncClient(host=self._ollama_url)
         self._session_uuid = uuid4
         self._chat_model = config.get("ollama", "chat_model")
         self._chat_num_ctx = config.getint("ollama", "chat_context_window")
-        self._chat_keep_alive = config.get("ollama", "chat_memory_duration")
+        self._chat_keep_alive = config.get(
+            "ollama", "chat_memory_duration", fallback="5m"
+        )
+        self._embedding_model = config.get(
+            "ollama", "embedding_model", fallback="nomic-embed-text"
+        )
         self._generative_model = config.get("ollama", "generative_model")
         self._generative_num_ctx = config.getint("ollama", "generative_context_window")
-        self._generative_keep_alive = config.get("ollama", "generative_memory_duration")
+        self._generative_keep_alive = config.get(
+            "ollama", "generative_memory_duration", fallback="5m"
+        )
         self._multimodal_model = config.get("ollama", "multimodal_model")
         self._multimodal_num_ctx = config.getint("ollama", "multimodal_context_window")
-        self._multimodal_keep_alive = config.get("ollama", "multimodal_memory_duration")
+        self._multimodal_keep_alive = config.get(
+            "ollama", "multimodal_memory_duration", fallback="5m"
+        )
+        self._openai_client = None
+
+        if config.get("ollama", "chat_backend", fallback="ollama") == "openai":
+            from openai import OpenAI
+
+            self._openai_client = OpenAI(
+                base_url=config.get("openai", "url"),
+                api_key=config.get("openai", "api_key", fallback="EMPTY")
+            )
+
+        self._chat_cache_similarity = config.getfloat(
+            "ollama", "chat_cache_similarity", fallback=0.92
+        )
+        self._chat_caches = {}
+        self._retrieved_documents = OrderedDict()
+        self._retrieval_caches = {}
+        self._rag_store_limit = config.getint(
+            "ollama", "rag_store_limit", fallback=16
+        )
+
+        if self._openai_client is None and config.getboolean(
+            "ollama", "warm_up", fallback=True
+        ):
+            Thread(target=self._warm_up, daemon=True).start()
 
         self.update_models()
 
+    def _warm_up(self) -> None:
+        """Load the chat model into memory ahead of the first request
+
+        An empty prompt makes Ollama load the model without generating
+        anything. This runs on a background thread while the rest of the
+        application starts, so the first chat does not pay for the load.
+        Failures are ignored; the first request will load the model anyway.
+        """
+
+        try:
+            self._client.generate(
+                model=self._chat_model, prompt="",
+                keep_alive=self._chat_keep_alive
+            )
+
+        except Exception:
+            pass
+
     def update_models(self) -> bool:
         """Update the database with any new models in the list provided by the Ollama API.
         """
@@ -190,43 +452,22 @@ class AssistantController(BaseController):
 
         return True
 
-    def chat(
-        self,
-        prompt: str,
-        temperature: Optional[float] = 0.5,
-        seed: Optional[int] = None,
-        priming: str = None,
-        options: Optional[dict] = None,
-        session_uuid: str = None,
-        keep_alive: Optional[Union[float, str]] = None
-    ):
-        """Chat with the Chat Assistant.
-
-        The temperature parameter is a float value between 0 and 1. Anything
-        greater than 0 will make the assistant more creative, but also more
-        unpredictable. The seed parameter is an integer value that can be used
-        to make the assistant's responses more predictable. If the temperature
-        is set to 0, then the assistant's response will be reproducible, given
-        the same seed value.
+    def _chat_messages(
+        self, session_uuid: str, priming: str = None
+    ) -> List[Message]:
+        """Build the system priming and the history of a chat session
 
         Parameters
         ----------
-        prompt : str
-            The prompt to be used when chatting with the assistant.
-        temperature : Optional[float]
-            The temperature to be used when making the request. Defaults to
-            0.5.
-        seed : Optional[int]
-            The seed to be used when making the request. Defaults to None.
-        priming : Optional[str]
-            The priming to be used when chatting with the assistant. Defaults to
-            None.
-        options : Optional[dict]
-            The options to be used when making the request.
         session_uuid : str
-            The UUID of the LM session to be used when making the request.
-        keep_alive : Optional[Union[float, str]]
-            The keep alive value to be used when making the request.
+            The UUID of the LM session whose history is replayed.
+        priming : Optional[str]
+            The priming to be used when chatting with the assistant.
+
+        Returns
+        -------
+        list
+            The messages to send ahead of the new prompt
         """
 
         with self._session as session:
@@ -235,30 +476,31 @@ class AssistantController(BaseController):
                 OllamaModel.model == self._chat_model
             ).first()
 
+            assistances = session.query(Assistance).filter_by(
+                session_uuid=session_uuid
+            ).order_by(Assistance.created).all()
+
         messages = []
 
         if model:
             if priming is not None:
                 messages.append(Message(role="system", content=priming))
 
-        session_uuid = self._session_uuid if not session_uuid else session_uuid
-
-        with self._session as session:
-
-            assistances = session.query(Assistance).filter_by(
-                session_uuid=session_uuid
-            ).order_by(Assistance.created).all()
+        if assistances:
+            for assistance in assistances:
+                messages.append(Message(
+                    role="user", content=assistance.prompt
+                ))
+                messages.append(Message(
+                    role="assistant", content=assistance.content
+                ))
 
-            if assistances:
-                for assistance in assistances:
-                    messages.append(Message(
-                        role="user", content=assistance.prompt
-                    ))
-                    messages.append(Message(
-                        role="assistant", content=assistance.content
-                    ))
+        return messages
 
-        messages.append(Message(role="user", content=prompt))
+    def _chat_options(
+        self, options: Optional[dict], temperature: Optional[float]
+    ) -> dict:
+        """Fill in the temperature and context window of a chat request"""
 
         if not options:
             options = {
@@ -272,24 +514,152 @@ class AssistantController(BaseController):
         if not options.get("num_ctx"):
             options["num_ctx"] = self._chat_num_ctx
 
-        keep_alive = self._chat_keep_alive if not keep_alive else keep_alive
+        return options
+
+    def _complete_chat(
+        self,
+        messages: List[Message],
+        options: dict,
+        keep_alive: Optional[Union[float, str]]
+    ) -> Mapping[str, Any]:
+        """Send a chat request to the configured backend
+
+        With ollama.chat_backend set to openai, the request goes to an
+        OpenAI-compatible server such as vLLM, which batches concurrent
+        requests on the GPU, and the completion is returned in the shape of
+        an Ollama chat response. Otherwise the Ollama client is used.
+
+        Parameters
+        ----------
+        messages : list
+            The messages of the conversation, ending with the prompt.
+        options : dict
+            The options to be used when making the request.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value, used by Ollama only.
+
+        Returns
+        -------
+        Mapping
+            The chat response
+        """
+
+        if self._openai_client is None:
+            return self._client.chat(
+                model=self._chat_model,
+                messages=messages,
+                format='',
+                options=options,
+                keep_alive=keep_alive
+            )
+
+        completion = self._openai_client.chat.completions.create(
+            model=self._chat_model,
+            messages=[dict(message) for message in messages],
+            temperature=options.get("temperature"),
+            seed=options.get("seed")
+        )
+
+        return _openai_response(
+            completion.choices[0].message.content, completion.usage
+        )
+
+    def _stream_chat(
+        self,
+        messages: List[Message],
+        options: dict,
+        keep_alive: Optional[Union[float, str]]
+    ) -> Iterator[Tuple[str, Mapping[str, Any]]]:
+        """Stream a chat request from the configured backend
+
+        Like _complete_chat(), but the response is yielded piece by piece,
+        each piece with the chunk it came in. The last chunk is shaped like
+        an Ollama chat response, so it can be recorded the same way.
+
+        Parameters
+        ----------
+        messages : list
+            The messages of the conversation, ending with the prompt.
+        options : dict
+            The options to be used when making the request.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value, used by Ollama only.
+
+        Returns
+        -------
+        Iterator
+            The pieces of the response content and their chunks
+        """
+
+        if self._openai_client is None:
+            for response in self._client.chat(
+                model=self._chat_model,
+                messages=messages,
+                format='',
+                options=options,
+                stream=True,
+                keep_alive=keep_alive
+            ):
+                piece = response["message"]["content"] if response.get("message") else ""
+                yield piece, response
+
+            return
+
+        usage = None
+
+        for chunk in self._openai_client.chat.completions.create(
+            model=self._chat_model,
+            messages=[dict(message) for message in messages],
+            temperature=options.get("temperature"),
+            seed=options.get("seed"),
+            stream=True,
+            stream_options={"include_usage": True}
+        ):
+            usage = chunk.usage or usage
+
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content, {}
+
+        yield "", _openai_response("", usage)
+
+    def _save_chat(
+        self,
+        assistant: str,
+        session_uuid: str,
+        priming: Optional[str],
+        prompt: str,
+        temperature: Optional[float],
+        seed: Optional[int],
+        response: Mapping[str, Any]
+    ) -> None:
+        """Record a chat response and the activity of the owner
+
+        Parameters
+        ----------
+        assistant : str
+            The name of the assistant that answered, e.g. "Chat Assistant".
+        session_uuid : str
+            The UUID of the LM session the exchange belongs to.
+        priming : Optional[str]
+            The priming that was used.
+        prompt : str
+            The prompt as the user wrote it.
+        temperature : Optional[float]
+            The temperature that was used.
+        seed : Optional[int]
+            The seed that was used.
+        response : Mapping[str, Any]
+            The response of the Ollama API.
+        """
 
         with self._session as session:
 
             try:
 
-                response = self._client.chat(
-                    model=self._chat_model,
-                    messages=messages,
-                    format='',
-                    options=options,
-                    keep_alive=keep_alive
-                )
-
                 assistance = Assistance(
                     user_id=self._owner.id,
                     session_uuid=session_uuid,
-                    assistant="Chat Assistant",
+                    assistant=assistant,
                     model=self._chat_model,
                     priming=priming,
                     prompt=prompt,
@@ -306,7 +676,7 @@ class AssistantController(BaseController):
                     created=datetime.now()
                 )
 
-                summary = f"{self._owner.username} used the Chat Assistant"
+                summary = f"{self._owner.username} used the {assistant}"
                 activity = Activity(
                     user_id=self._owner.id, summary=summary,
                     created=datetime.now()
@@ -321,150 +691,523 @@ class AssistantController(BaseController):
 
             else:
                 session.commit()
-                return response
 
-    def rag_chat(
+    def chat(
         self,
         prompt: str,
-        documents: List[str],
         temperature: Optional[float] = 0.5,
         seed: Optional[int] = None,
         priming: str = None,
         options: Optional[dict] = None,
         session_uuid: str = None,
-        keep_alive: Optional[Union[float, str]] = None
+        keep_alive: Optional[Union[float, str]] = None,
+        cache: bool = False
     ):
-        with self._session as session:
+        """Chat with the Chat Assistant.
 
-            model = session.query(OllamaModel).filter(
-                OllamaModel.model == self._chat_model
-            ).first()
+        The temperature parameter is a float value between 0 and 1. Anything
+        greater than 0 will make the assistant more creative, but also more
+        unpredictable. The seed parameter is an integer value that can be used
+        to make the assistant's responses more predictable. If the temperature
+        is set to 0, then the assistant's response will be reproducible, given
+        the same seed value.
 
-        messages = []
+        Parameters
+        ----------
+        prompt : str
+            The prompt to be used when chatting with the assistant.
+        temperature : Optional[float]
+            The temperature to be used when making the request. Defaults to
+            0.5.
+        seed : Optional[int]
+            The seed to be used when making the request. Defaults to None.
+        priming : Optional[str]
+            The priming to be used when chatting with the assistant. Defaults to
+            None.
+        options : Optional[dict]
+            The options to be used when making the request.
+        session_uuid : str
+            The UUID of the LM session to be used when making the request.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value to be used when making the request.
+        cache : bool
+            Answer from the semantic cache when an earlier prompt to the chat
+            model with the same priming is similar enough to this one. Cached
+            answers do not take the session history into account, so this is
+            meant for standalone questions. Defaults to False.
+        """
 
-        if model:
-            if priming is not None:
-                messages.append(Message(role="system", content=priming))
+        session_uuid = self._session_uuid if not session_uuid else session_uuid
+        messages = self._chat_messages(session_uuid, priming)
+        messages.append(Message(role="user", content=prompt))
+        options = self._chat_options(options, temperature)
+        keep_alive = self._chat_keep_alive if keep_alive is None else keep_alive
+
+        response = None
+
+        if cache:
+            chat_cache = self._chat_caches.setdefault(
+                priming, _SemanticCache(self._chat_cache_similarity)
+            )
+            vector = self._client.embeddings(
+                model=self._embedding_model, prompt=prompt,
+                keep_alive=keep_alive
+            )["embedding"]
+            response = chat_cache.lookup(vector)
+
+        if response is None:
+            response = self._complete_chat(messages, options, keep_alive)
+
+            if cache:
+                chat_cache.insert(vector, response)
+
+        self._save_chat(
+            "Chat Assistant", session_uuid, priming, prompt, temperature,
+            seed, response
+        )
+
+        return response
+
+    def stream_chat(
+        self,
+        prompt: str,
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None
+    ) -> Iterator[str]:
+        """Chat with the Chat Assistant, yielding the response as it arrives.
+
+        This takes the same parameters as chat(), but streams the response
+        so the first words can be shown after the first decoding step rather
+        than after the whole completion. The exchange is recorded once the
+        stream is exhausted.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt to be used when chatting with the assistant.
+        temperature : Optional[float]
+            The temperature to be used when making the request. Defaults to
+            0.5.
+        seed : Optional[int]
+            The seed to be used when making the request. Defaults to None.
+        priming : Optional[str]
+            The priming to be used when chatting with the assistant. Defaults to
+            None.
+        options : Optional[dict]
+            The options to be used when making the request.
+        session_uuid : str
+            The UUID of the LM session to be used when making the request.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value to be used when making the request.
+
+        Returns
+        -------
+        Iterator
+            The pieces of the response content
+        """
 
         session_uuid = self._session_uuid if not session_uuid else session_uuid
+        messages = self._chat_messages(session_uuid, priming)
+        messages.append(Message(role="user", content=prompt))
+        options = self._chat_options(options, temperature)
+        keep_alive = self._chat_keep_alive if keep_alive is None else keep_alive
 
-        with self._session as session:
+        content = []
+        response = {}
 
-            assistances = session.query(Assistance).filter_by(
-                session_uuid=session_uuid
-            ).order_by(Assistance.created).all()
+        for piece, response in self._stream_chat(messages, options, keep_alive):
+            content.append(piece)
 
-            if assistances:
-                for assistance in assistances:
-                    messages.append(Message(
-                        role="user", content=assistance.prompt
-                    ))
-                    messages.append(Message(
-                        role="assistant", content=assistance.content
-                    ))
+            if piece:
+                yield piece
 
-        if len(documents) > 1:
+        # the last chunk carries the timings; give it the whole content so it
+        # is recorded like a response that was not streamed
+        response = dict(response)
+        response["message"] = {"role": "assistant", "content": "".join(content)}
 
-            noveler_root = os.path.dirname(os.path.abspath(__file__))
-            tmp_dir = f"{noveler_root}/tmp"
-            session_tmp_dir = f"{tmp_dir}/{self._session_uuid}"
+        self._save_chat(
+            "Chat Assistant", session_uuid, priming, prompt, temperature,
+            seed, response
+        )
+
+    async def achat(
+        self,
+        prompt: str,
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None
+    ):
+        """Chat with the Chat Assistant without blocking the event loop.
 
-            if not os.path.exists(session_tmp_dir):
-                os.makedirs(session_tmp_dir)
+        This is the coroutine version of chat() and takes the same
+        parameters. The request to Ollama is awaited on an AsyncClient, so
+        several chats can be run concurrently with asyncio.gather() instead
+        of one thread per request; with the openai chat backend the request
+        runs on a worker thread instead. Reading the history and recording the
+        response still use the database session synchronously.
 
-            for document in documents:
-                filename = os.path.basename(document).split('/')[-1]
-                if os.path.isfile(document) and not os.path.isfile(f"{session_tmp_dir}/{filename}"):
-                    shutil.copy(document, f"{session_tmp_dir}/{filename}")
+        Parameters
+        ----------
+        prompt : str
+            The prompt to be used when chatting with the assistant.
+        temperature : Optional[float]
+            The temperature to be used when making the request. Defaults to
+            0.5.
+        seed : Optional[int]
+            The seed to be used when making the request. Defaults to None.
+        priming : Optional[str]
+            The priming to be used when chatting with the assistant. Defaults to
+            None.
+        options : Optional[dict]
+            The options to be used when making the request.
+        session_uuid : str
+            The UUID of the LM session to be used when making the request.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value to be used when making the request.
+        """
 
-            loader = DirectoryLoader(path=session_tmp_dir, load_hidden=False)
+        session_uuid = self._session_uuid if not session_uuid else session_uuid
+        messages = self._chat_messages(session_uuid, priming)
+        messages.append(Message(role="user", content=prompt))
+        options = self._chat_options(options, temperature)
+        keep_alive = self._chat_keep_alive if keep_alive is None else keep_alive
+
+        if self._openai_client is None:
+            response = await self._async_client.chat(
+                model=self._chat_model,
+                messages=messages,
+                format='',
+                options=options,
+                keep_alive=keep_alive
+            )
 
         else:
+            response = await asyncio.to_thread(
+                self._complete_chat, messages, options, keep_alive
+            )
+
+        self._save_chat(
+            "Chat Assistant", session_uuid, priming, prompt, temperature,
+            seed, response
+        )
+
+        return response
+
+    def _documents_digest(self, documents: List[str]) -> str:
+        """Hash the embedding model and the contents of the documents
 
-            loader = TextLoader(file_path=documents[0])
+        Parameters
+        ----------
+        documents : List[str]
+            The paths of the documents.
+
+        Returns
+        -------
+        str
+            The hexadecimal SHA-256 digest
+        """
+
+        digest = hashlib.sha256(self._embedding_model.encode())
+
+        for document in documents:
+            if os.path.isfile(document):
+                with open(document, "rb") as file:
+                    for block in iter(lambda: file.read(65536), b""):
+                        digest.update(block)
+
+        return digest.hexdigest()
+
+    def _rag_vectorstore(
+        self, documents: List[str], digest: str
+    ) -> Tuple[Chroma, Embeddings]:
+        """Open the vector store of a set of documents, building it if needed
+
+        The vector store is persisted under the digest of the embedding model
+        and the documents' contents, so asking about the same documents again
+        reuses the stored embeddings instead of recomputing them.
+
+        Parameters
+        ----------
+        documents : List[str]
+            The paths of the documents.
+        digest : str
+            The digest returned by _documents_digest() for the documents.
+
+        Returns
+        -------
+        tuple
+            The vector store and the embeddings model it uses
+        """
 
-        input_docs = loader.load()
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000, chunk_overlap=0
+        noveler_root = os.path.dirname(os.path.abspath(__file__))
+        tmp_dir = f"{noveler_root}/tmp"
+
+        # Create Ollama embeddings and vector store, embedding the splits in
+        # concurrent batches rather than one request at a time
+        embeddings = _BatchedEmbeddings(
+            OllamaEmbeddings(
+                base_url=self._ollama_url, model=self._embedding_model
+            )
+        )
+        chroma_dir = f"{tmp_dir}/chroma"
+        vectorstore = Chroma(
+            persist_directory=f"{chroma_dir}/{digest}",
+            embedding_function=embeddings,
+            collection_metadata=_RAG_HNSW_METADATA
         )
-        splits = text_splitter.split_documents(documents=input_docs)
 
-        # Create Ollama embeddings and vector store
-        embeddings = OllamaEmbeddings(model=f"{self._chat_model}")
-        vectorstore = Chroma.from_documents(
-            documents=splits, embedding=embeddings
+        if vectorstore._collection.count() == 0:
+
+            if len(documents) > 1:
+
+                # load from a directory holding only these documents, so no
+                # file left over from another call is stored under the digest
+                with tempfile.TemporaryDirectory(dir=tmp_dir) as documents_dir:
+
+                    for document in documents:
+                        filename = os.path.basename(document)
+                        if os.path.isfile(document):
+                            shutil.copy(document, f"{documents_dir}/{filename}")
+
+                    input_docs = DirectoryLoader(
+                        path=documents_dir, load_hidden=False
+                    ).load()
+
+            else:
+
+                input_docs = TextLoader(file_path=documents[0]).load()
+
+            # the chunk size is in estimated tokens, four characters each, as
+            # the model's tokenizer is not available client side; this is
+            # about 1024 characters per split
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=256, chunk_overlap=32,
+                length_function=_estimate_tokens
+            )
+            splits = text_splitter.split_documents(documents=input_docs)
+            vectorstore.add_documents(documents=splits)
+
+        self._evict_vectorstores(chroma_dir, digest)
+
+        return vectorstore, embeddings
+
+    def _evict_vectorstores(self, chroma_dir: str, digest: str) -> None:
+        """Delete the least recently used persisted vector stores
+
+        The store of the given digest is marked as just used, and only the
+        _rag_store_limit most recently used stores are kept on disk.
+
+        Parameters
+        ----------
+        chroma_dir : str
+            The directory holding one vector store per digest.
+        digest : str
+            The digest of the vector store in use.
+        """
+
+        os.utime(f"{chroma_dir}/{digest}")
+        stores = sorted(
+            (entry for entry in os.scandir(chroma_dir) if entry.is_dir()),
+            key=lambda entry: entry.stat().st_mtime, reverse=True
         )
 
-        # Create the retriever
-        retriever = vectorstore.as_retriever()
-        retrieved_docs = retriever.invoke(prompt)
-        formatted_context = "\n\n".join(doc.page_content for doc in retrieved_docs)
-        formatted_prompt = f"Question: {prompt}\n\nContext: {formatted_context}"
+        for entry in stores[self._rag_store_limit:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
 
-        messages.append(Message(role="user", content=formatted_prompt))
+    def _retrieve(
+        self, prompts: List[str], documents: List[str], digest: str,
+        cache: bool = False
+    ) -> List[list]:
+        """Retrieve the splits of a set of documents relevant to each prompt
 
-        if not options:
-            options = {
-                "temperature": temperature,
-                "num_ctx": self._chat_num_ctx
-            }
+        Retrievals are cached by exact prompt and, when cache is set, through
+        the prompt embedding by similar prompts. The vector store is only
+        opened when at least one prompt misses the exact cache.
 
-        if not options.get("temperature"):
-            options["temperature"] = temperature
+        Parameters
+        ----------
+        prompts : List[str]
+            The questions to retrieve documents for.
+        documents : List[str]
+            The paths of the documents.
+        digest : str
+            The digest returned by _documents_digest() for the documents.
+        cache : bool
+            Reuse the retrieval of an earlier prompt whose embedding is
+            similar enough to the prompt's. Defaults to False.
+
+        Returns
+        -------
+        list
+            The retrieved splits of each prompt, in the order of the prompts
+        """
 
-        if not options.get("num_ctx"):
-            options["num_ctx"] = self._chat_num_ctx
+        vectorstore = embeddings = None
+        retrievals = []
 
-        keep_alive = self._chat_keep_alive if not keep_alive else keep_alive
+        for prompt in prompts:
+            retrieved_docs = self._retrieved_documents.get((digest, prompt))
 
-        with self._session as session:
+            if retrieved_docs is not None:
+                self._retrieved_documents.move_to_end((digest, prompt))
+                retrievals.append(retrieved_docs)
+                continue
 
-            try:
+            if vectorstore is None:
+                vectorstore, embeddings = self._rag_vectorstore(documents, digest)
 
-                response = self._client.chat(
-                    model=self._chat_model,
-                    messages=messages,
-                    format='',
-                    options=options,
-                    keep_alive=keep_alive
-                )
+            vector = embeddings.embed_query(prompt)
 
-                assistance = Assistance(
-                    user_id=self._owner.id,
-                    session_uuid=session_uuid,
-                    assistant="RAG Chat Assistant",
-                    model=self._chat_model,
-                    priming=priming,
-                    prompt=prompt,
-                    temperature=temperature,
-                    seed=seed,
-                    content=response["message"]["content"] if response.get("message") else None,
-                    done=response["done"],
-                    total_duration=response["total_duration"] if response.get("total_duration") else None,
-                    load_duration=response["load_duration"] if response.get("load_duration") else None,
-                    prompt_eval_count=response["prompt_eval_count"] if response.get("prompt_eval_count") else None,
-                    prompt_eval_duration=response["prompt_eval_duration"] if response.get("prompt_eval_duration") else None,
-                    eval_count=response["eval_count"] if response.get("eval_count") else None,
-                    eval_duration=response["eval_duration"] if response.get("eval_duration") else None,
-                    created=datetime.now()
+            if cache:
+                # a question phrased differently but meaning the same as an
+                # earlier one about these documents reuses its retrieval
+                retrieval_cache = self._retrieval_caches.setdefault(
+                    digest, _SemanticCache(self._chat_cache_similarity)
                 )
+                retrieved_docs = retrieval_cache.lookup(vector)
 
-                summary = f"{self._owner.username} used the RAG Chat Assistant"
-                activity = Activity(
-                    user_id=self._owner.id, summary=summary,
-                    created=datetime.now()
-                )
+                if retrieved_docs is None:
+                    retrieved_docs = vectorstore.similarity_search_by_vector(vector)
+                    retrieval_cache.insert(vector, retrieved_docs)
 
-                session.add(assistance)
-                session.add(activity)
+            else:
+                retrieved_docs = vectorstore.similarity_search_by_vector(vector)
 
-            except Exception as e:
-                session.rollback()
-                raise e
+            self._retrieved_documents[(digest, prompt)] = retrieved_docs
 
-            else:
-                session.commit()
-                return response
+            if len(self._retrieved_documents) > 256:
+                self._retrieved_documents.popitem(last=False)
+
+            retrievals.append(retrieved_docs)
+
+        return retrievals
+
+    def rag_chat(
+        self,
+        prompt: str,
+        documents: List[str],
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None,
+        cache: bool = False
+    ):
+        session_uuid = self._session_uuid if not session_uuid else session_uuid
+        messages = self._chat_messages(session_uuid, priming)
+
+        digest = self._documents_digest(documents)
+        retrieved_docs = self._retrieve([prompt], documents, digest, cache)[0]
+
+        messages.append(
+            Message(role="user", content=_rag_prompt(prompt, retrieved_docs))
+        )
+        options = self._chat_options(options, temperature)
+        keep_alive = self._chat_keep_alive if keep_alive is None else keep_alive
+
+        response = self._complete_chat(messages, options, keep_alive)
+
+        self._save_chat(
+            "RAG Chat Assistant", session_uuid, priming, prompt, temperature,
+            seed, response
+        )
+
+        return response
+
+    def rag_chat_batch(
+        self,
+        prompts: List[str],
+        documents: List[str],
+        temperature: Optional[float] = 0.5,
+        seed: Optional[int] = None,
+        priming: str = None,
+        options: Optional[dict] = None,
+        session_uuid: str = None,
+        keep_alive: Optional[Union[float, str]] = None,
+        cache: bool = False
+    ) -> List[Mapping[str, Any]]:
+        """Ask several independent questions about the same documents.
+
+        Each question is answered as rag_chat() would answer it on its own,
+        against the session history as it stood before the batch. The
+        retrievals share one vector store, and up to eight chat requests are
+        sent concurrently, so a batch of that size takes about as long as its
+        slowest question rather than the sum of all of them. The database is only
+        used from the calling thread.
+
+        Parameters
+        ----------
+        prompts : List[str]
+            The questions to be asked.
+        documents : List[str]
+            The paths of the documents to answer from.
+        temperature : Optional[float]
+            The temperature to be used when making the requests. Defaults to
+            0.5.
+        seed : Optional[int]
+            The seed to be used when making the requests. Defaults to None.
+        priming : Optional[str]
+            The priming to be used when chatting with the assistant. Defaults to
+            None.
+        options : Optional[dict]
+            The options to be used when making the requests.
+        session_uuid : str
+            The UUID of the LM session to be used when making the requests.
+        keep_alive : Optional[Union[float, str]]
+            The keep alive value to be used when making the requests.
+        cache : bool
+            Reuse the documents retrieved for an earlier question whose
+            embedding is at least as similar as the chat_cache_similarity
+            setting. Defaults to False.
+
+        Returns
+        -------
+        list
+            The responses, in the order of the prompts
+        """
+
+        if not prompts:
+            return []
+
+        session_uuid = self._session_uuid if not session_uuid else session_uuid
+        history = self._chat_messages(session_uuid, priming)
+        retrievals = self._retrieve(
+            prompts, documents, self._documents_digest(documents), cache
+        )
+        options = self._chat_options(options, temperature)
+        keep_alive = self._chat_keep_alive if keep_alive is None else keep_alive
+
+        conversations = []
+
+        for prompt, retrieved_docs in zip(prompts, retrievals):
+            conversations.append(history + [
+                Message(role="user", content=_rag_prompt(prompt, retrieved_docs))
+            ])
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(prompts), _MAX_CHAT_WORKERS)
+        ) as pool:
+            responses = list(pool.map(
+                lambda messages: self._complete_chat(messages, options, keep_alive),
+                conversations
+            ))
+
+        for prompt, response in zip(prompts, responses):
+            self._save_chat(
+                "RAG Chat Assistant", session_uuid, priming, prompt,
+                temperature, seed, response
+            )
+
+        return responses
 
     def describe_image(
             self,
@@ -528,7 +1271,7 @@ class AssistantController(BaseController):
         if not options.get("num_ctx"):
             options["num_ctx"] = self._multimodal_num_ctx
 
-        keep_alive = self._multimodal_keep_alive if not keep_alive else keep_alive
+        keep_alive = self._multimodal_keep_alive if keep_alive is None else keep_alive
 
         with self._session as session:
 
@@ -632,7 +1375,7 @@ class AssistantController(BaseController):
         if not options.get("num_ctx"):
             options["num_ctx"] = self._generative_num_ctx
 
-        keep_alive = self._generative_keep_alive if not keep_alive else keep_alive
+        keep_alive = self._generative_keep_alive if keep_alive is None else keep_alive
 
         with self._session as session:
 
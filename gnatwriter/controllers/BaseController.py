@@ -1,5 +1,7 @@
 from configparser import ConfigParser
-from typing import Type
+from contextlib import contextmanager
+from typing import Type, Iterator
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 from gnatwriter.models import User
 
@@ -39,3 +41,82 @@ class BaseController:
         self._config = config
         self._session = session
         self._owner = owner
+
+    @contextmanager
+    def _readonly_session(self) -> Iterator[Session]:
+        """Open the session for a unit of work that only reads
+
+        The connection is checked out in autocommit mode, so reads are not
+        wrapped in a BEGIN/COMMIT pair, and is flagged read-only on PostgreSQL.
+        Both settings are reset when the connection returns to the pool. If
+        the session is already in a transaction, its connection is used as it
+        is, since execution options can only be set on a new connection.
+
+        Returns
+        -------
+        Iterator
+            The database session
+        """
+
+        with self._session as session:
+            if not session.in_transaction():
+                execution_options = {"isolation_level": "AUTOCOMMIT"}
+
+                if session.get_bind().dialect.name == "postgresql":
+                    execution_options["postgresql_readonly"] = True
+
+                session.connection(execution_options=execution_options)
+
+            yield session
+
+    @contextmanager
+    def _private_session(self) -> Iterator[Session]:
+        """Open a session of its own on the engine of the shared session
+
+        Generators that stream rows keep their session open between yields.
+        Every other controller method closes the shared session when it is
+        done, which would invalidate a stream running on it, so streams use
+        a session nobody else touches.
+
+        Returns
+        -------
+        Iterator
+            The database session
+        """
+
+        with Session(
+            bind=self._session.get_bind(), expire_on_commit=False
+        ) as session:
+            yield session
+
+    @staticmethod
+    def _estimate_row_count(session: Session, model: Type) -> int:
+        """Estimate the number of rows in the table of a model
+
+        On PostgreSQL the planner statistics are read from pg_class, which is
+        O(1) but only as fresh as the last ANALYZE. Other backends fall back to
+        an exact count.
+
+        Parameters
+        ----------
+        session : Session
+            The database session
+        model : Type
+            The mapped class whose table is counted
+
+        Returns
+        -------
+        int
+            The approximate number of rows
+        """
+
+        if session.get_bind().dialect.name == "postgresql":
+            estimate = session.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table_name"),
+                {"table_name": model.__tablename__}
+            ).scalar()
+
+            if estimate is not None and estimate >= 0:
+                return estimate
+
+        return session.query(func.count()).select_from(model).scalar()
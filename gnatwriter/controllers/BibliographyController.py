@@ -2,7 +2,6 @@ from configparser import ConfigParser
 from datetime import datetime
 from typing import Type, List
 
-from gnatwriter.models.BibliographyAuthor import BibliographyAuthor
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 from gnatwriter.controllers.BaseController import BaseController
@@ -1,13 +1,30 @@
-import os
 from configparser import ConfigParser
 from datetime import datetime
-from typing import Type, List
+from typing import Type, List, Tuple
 from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer, raiseload
 from gnatwriter.controllers import BaseController
 from gnatwriter.models import User, Chapter, Activity, Scene, Link, ChapterLink, Note, ChapterNote
 
 
+def _chapter_row_options() -> tuple:
+    """Loader options for chapters whose content and collections go unused
+
+    Chapter loads its description and collections along with the row so
+    that the chapters returned to callers are complete. Queries that only
+    touch the chapter rows themselves, such as renumbering siblings, leave
+    out the description text and skip the extra SELECTs of the collections,
+    and any accidental access to a collection raises instead of loading it.
+    """
+
+    return (
+        defer(Chapter.description),
+        raiseload(Chapter.scenes),
+        raiseload(Chapter.links),
+        raiseload(Chapter.notes),
+    )
+
+
 class ChapterController(BaseController):
     """Chapter controller encapsulates chapter management functionality
 
@@ -40,6 +57,8 @@ class ChapterController(BaseController):
         Get all chapters associated with a story
     get_chapters_page_by_story_id(story_id: int, page: int, per_page: int)
         Get a single page of chapters associated with a story from the database
+    get_chapters_page_and_count_by_story_id(story_id: int, page: int, per_page: int)
+        Get a single page of chapters of a story and the story's chapter count
     count_chapters_by_story_id(story_id: int)
         Get chapter count associated with a story
     search_chapters(search: str)
@@ -93,9 +112,9 @@ class ChapterController(BaseController):
 
             try:
 
-                title_exists = session.query(Chapter).filter(
+                title_exists = session.query(Chapter.id).filter(
                     Chapter.title == title, Chapter.story_id == story_id, Chapter.user_id == self._owner.id
-                ).first()
+                ).first() is not None
 
                 if title_exists:
                     raise Exception('This story already has a chapter with the same title.')
@@ -162,11 +181,11 @@ class ChapterController(BaseController):
                 if not chapter:
                     raise ValueError('Chapter not found.')
 
-                title_exists = session.query(Chapter).filter(
+                title_exists = session.query(Chapter.id).filter(
                     Chapter.title == title,
                     Chapter.story_id == chapter.story_id,
                     Chapter.user_id == self._owner.id
-                ).first()
+                ).first() is not None
 
                 if title_exists:
                     raise Exception('This story already has a chapter with the \
@@ -213,10 +232,6 @@ class ChapterController(BaseController):
             True if the chapter was deleted, False if not
         """
 
-        config = ConfigParser()
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        config.read(f"{project_root}/config.cfg")
-
         with self._session as session:
 
             try:
@@ -233,13 +248,13 @@ class ChapterController(BaseController):
                     Chapter.story_id == chapter.story_id,
                     Chapter.user_id == self._owner.id,
                     Chapter.position > chapter.position
-                ).all()
+                ).options(*_chapter_row_options()).all()
 
                 for sibling in siblings:
                     sibling.position -= 1
                     sibling.created = datetime.strptime(
                         str(sibling.created),
-                        config.get("formats", "datetime")
+                        self._config.get("formats", "datetime")
                     )
                     sibling.modified = datetime.now()
 
@@ -284,10 +299,6 @@ class ChapterController(BaseController):
             The updated chapter object
         """
 
-        config = ConfigParser()
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        config.read(f"{project_root}/config.cfg")
-
         with self._session as session:
 
             try:
@@ -323,13 +334,13 @@ class ChapterController(BaseController):
                         Chapter.user_id == self._owner.id,
                         Chapter.position >= position,
                         Chapter.position < chapter.position
-                    ).all()
+                    ).options(*_chapter_row_options()).all()
 
                     for sibling in siblings:
                         sibling.position += 1
                         sibling.created = datetime.strptime(
                             str(sibling.created),
-                            config.get("formats", "datetime")
+                            self._config.get("formats", "datetime")
                         )
                         sibling.modified = datetime.now()
 
@@ -339,13 +350,13 @@ class ChapterController(BaseController):
                         Chapter.user_id == self._owner.id,
                         Chapter.position > chapter.position,
                         Chapter.position <= position
-                    ).all()
+                    ).options(*_chapter_row_options()).all()
 
                     for sibling in siblings:
                         sibling.position -= 1
                         sibling.created = datetime.strptime(
                             str(sibling.created),
-                            config.get("formats", "datetime")
+                            self._config.get("formats", "datetime")
                         )
                         sibling.modified = datetime.now()
 
@@ -494,6 +505,49 @@ class ChapterController(BaseController):
                 Chapter.position
             ).offset(offset).limit(per_page).all()
 
+    def get_chapters_page_and_count_by_story_id(
+        self, story_id: int, page: int, per_page: int
+    ) -> Tuple[List[Type[Chapter]], int]:
+        """Get a single page of chapters of a story and the story's chapter count
+
+        The count is computed with a window function in the same query as the
+        page, so callers that need both make one round trip instead of two.
+        The returned list will be sorted by the position.
+
+        Parameters
+        ----------
+        story_id : int
+            The id of the story
+        page : int
+            The page number
+        per_page : int
+            The number of rows per page
+
+        Returns
+        -------
+        tuple
+            A list of chapter objects and the total number of chapters
+        """
+
+        with self._session as session:
+
+            offset = (page - 1) * per_page
+
+            rows = session.query(
+                Chapter, func.count().over().label('total')
+            ).filter(
+                Chapter.story_id == story_id,
+                Chapter.user_id == self._owner.id
+            ).order_by(
+                Chapter.position
+            ).offset(offset).limit(per_page).all()
+
+        if not rows:
+            # past the last page there is no row to carry the window count
+            return [], self.count_chapters_by_story_id(story_id) if page > 1 else 0
+
+        return [row.Chapter for row in rows], rows[0].total
+
     def count_chapters_by_story_id(self, story_id: int) -> int:
         """Get chapter count associated with a story
 
@@ -584,10 +638,10 @@ class ChapterController(BaseController):
 
         with self._session as session:
 
-            return session.query(Scene).filter(
+            return session.query(Scene.id).filter(
                 Scene.chapter_id == chapter_id,
                 Scene.user_id == self._owner.id
-            ).count() > 0
+            ).first() is not None
 
     def get_scene_by_position(
         self, chapter_id: int, position: int
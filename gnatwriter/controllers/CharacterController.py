@@ -1,13 +1,45 @@
 from datetime import datetime
 from typing import Type, List
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, select, Row
+from sqlalchemy.orm import Session, defer, raiseload, with_loader_criteria
 from gnatwriter.controllers.BaseController import BaseController
 from gnatwriter.models import User, Character, CharacterStory, Activity, CharacterRelationship, CharacterTrait, Event, \
     CharacterEvent, Link, CharacterLink, Note, CharacterNote, Image, CharacterImage
 from configparser import ConfigParser
 
 
+def _character_row_options() -> tuple:
+    """Loader options for characters that are only checked for and referenced
+
+    Used when confirming a character exists before linking a row to it.
+    """
+
+    return (
+        defer(Character.description),
+        raiseload(Character.character_relationships),
+        raiseload(Character.traits),
+        raiseload(Character.events),
+        raiseload(Character.images),
+        raiseload(Character.links),
+        raiseload(Character.notes),
+        raiseload(Character.stories),
+    )
+
+
+def _default_image_options() -> tuple:
+    """Loader options that limit a character's images to the default image
+
+    List views only show each character's avatar, so the images collection
+    is loaded with just the default image instead of the whole gallery.
+    """
+
+    return (
+        with_loader_criteria(
+            CharacterImage, CharacterImage.is_default.is_(True)
+        ),
+    )
+
+
 class CharacterController(BaseController):
     """Character controller encapsulates characters management functionality
 
@@ -39,9 +71,11 @@ class CharacterController(BaseController):
         Get a character by id
     get_character_count()
         Get character count associated with a user
-    get_all_characters()
+    get_all_characters(default_image_only: bool)
         Get all characters associated with a user
-    get_all_characters_page(page: int, per_page: int)
+    get_all_character_summaries()
+        Get the names and modified date of all characters of a user
+    get_all_characters_page(page: int, per_page: int, default_image_only: bool)
         Get a single page of characters from the database associated with a user
     get_character_count_by_story_id(story_id: int)
         Get character count associated with a story
@@ -444,9 +478,16 @@ class CharacterController(BaseController):
                 Character.user_id == self._owner.id
             ).scalar()
 
-    def get_all_characters(self) -> List[Type[Character]]:
+    def get_all_characters(
+        self, default_image_only: bool = False
+    ) -> List[Type[Character]]:
         """Get all characters associated with a user
 
+        Parameters
+        ----------
+        default_image_only : bool
+            Load only the default image of each character rather than all of its images, defaults to False
+
         Returns
         -------
         list
@@ -454,12 +495,40 @@ class CharacterController(BaseController):
         """
 
         with self._session as session:
-            return session.query(Character).filter(
+            query = session.query(Character)
+            if default_image_only:
+                query = query.options(*_default_image_options())
+            return query.filter(
                 Character.user_id == self._owner.id
             ).all()
 
+    def get_all_character_summaries(self) -> List[Row]:
+        """Get the names and modified date of all characters of a user
+
+        Only the name columns are selected, so list views skip hydrating full
+        Character objects, their seven eager-loaded collections, and the
+        potentially large description column.
+
+        Returns
+        -------
+        list
+            A list of (id, title, first_name, middle_name, last_name,
+            nickname, modified) rows ordered by last and first name
+        """
+
+        with self._readonly_session() as session:
+            return session.execute(
+                select(
+                    Character.id, Character.title, Character.first_name,
+                    Character.middle_name, Character.last_name,
+                    Character.nickname, Character.modified
+                ).where(
+                    Character.user_id == self._owner.id
+                ).order_by(Character.last_name, Character.first_name)
+            ).all()
+
     def get_all_characters_page(
-        self, page: int, per_page: int
+        self, page: int, per_page: int, default_image_only: bool = False
     ) -> List[Type[Character]]:
         """Get a single page of characters from the database associated with a user
 
@@ -469,6 +538,8 @@ class CharacterController(BaseController):
             The page number
         per_page : int
             The number of rows per page
+        default_image_only : bool
+            Load only the default image of each character rather than all of its images, defaults to False
 
         Returns
         -------
@@ -478,7 +549,10 @@ class CharacterController(BaseController):
 
         with self._session as session:
             offset = (page - 1) * per_page
-            return session.query(Character).filter(
+            query = session.query(Character)
+            if default_image_only:
+                query = query.options(*_default_image_options())
+            return query.filter(
                 Character.user_id == self._owner.id
             ).offset(offset).limit(per_page).all()
 
@@ -675,14 +749,14 @@ class CharacterController(BaseController):
 
                 parent = session.query(Character).filter(
                     Character.id == parent_id, Character.user_id == self._owner.id
-                ).first()
+                ).options(*_character_row_options()).first()
 
                 if not parent:
                     raise ValueError('Parent character not found.')
 
                 related = session.query(Character).filter(
                     Character.id == related_id, Character.user_id == self._owner.id
-                ).first()
+                ).options(*_character_row_options()).first()
 
                 if not related:
                     raise ValueError('Related character not found.')
@@ -1018,7 +1092,7 @@ class CharacterController(BaseController):
                 character = session.query(Character).filter(
                     Character.id == character_id,
                     Character.user_id == self._owner.id
-                ).first()
+                ).options(*_character_row_options()).first()
 
                 if not character:
                     raise ValueError('Character not found.')
@@ -1134,9 +1208,7 @@ class CharacterController(BaseController):
         with self._session as session:
             try:
 
-                config = ConfigParser()
-                config.read("config.cfg")
-                datetime_format = config.get("formats", "datetime")
+                datetime_format = self._config.get("formats", "datetime")
                 character_trait = session.query(CharacterTrait).filter(
                     CharacterTrait.id == trait_id, CharacterTrait.user_id == self._owner.id
                 ).first()
@@ -1226,9 +1298,7 @@ class CharacterController(BaseController):
         with self._session as session:
             try:
 
-                config = ConfigParser()
-                config.read("config.cfg")
-                datetime_format = config.get("formats", "datetime")
+                datetime_format = self._config.get("formats", "datetime")
 
                 character_trait = session.query(CharacterTrait).filter(
                     CharacterTrait.id == trait_id,
@@ -1415,14 +1485,13 @@ class CharacterController(BaseController):
         """
 
         with self._session as session:
-            for character_event in session.query(CharacterEvent).filter(
+            yield from session.query(Event).join(
+                CharacterEvent, Event.id == CharacterEvent.event_id
+            ).filter(
                 CharacterEvent.character_id == character_id,
-                    CharacterEvent.user_id == self._owner.id
-            ).all():
-                yield session.query(Event).filter(
-                    Event.id == character_event.event_id,
-                    Event.user_id == self._owner.id
-                ).first()
+                CharacterEvent.user_id == self._owner.id,
+                Event.user_id == self._owner.id
+            ).all()
 
     def get_events_page_by_character_id(
         self, character_id: int, page: int, per_page: int
@@ -1525,14 +1594,13 @@ class CharacterController(BaseController):
         """
 
         with self._session as session:
-            for character_link in session.query(CharacterLink).filter(
+            yield from session.query(Link).join(
+                CharacterLink, Link.id == CharacterLink.link_id
+            ).filter(
                 CharacterLink.character_id == character_id,
-                CharacterLink.user_id == self._owner.id
-            ).all():
-                yield session.query(Link).filter(
-                    Link.id == character_link.link_id,
-                    Link.user_id == self._owner.id
-                ).first()
+                CharacterLink.user_id == self._owner.id,
+                Link.user_id == self._owner.id
+            ).all()
 
     def get_links_page_by_character_id(
         self, character_id: int, page: int, per_page: int
@@ -1635,14 +1703,13 @@ class CharacterController(BaseController):
         """
 
         with self._session as session:
-            for character_note in session.query(CharacterNote).filter(
+            yield from session.query(Note).join(
+                CharacterNote, Note.id == CharacterNote.note_id
+            ).filter(
                 CharacterNote.character_id == character_id,
-                CharacterNote.user_id == self._owner.id
-            ).all():
-                yield session.query(Note).filter(
-                    Note.id == character_note.note_id,
-                    Note.user_id == self._owner.id
-                ).first()
+                CharacterNote.user_id == self._owner.id,
+                Note.user_id == self._owner.id
+            ).all()
 
     def get_notes_page_by_character_id(
         self, character_id: int, page: int, per_page: int
@@ -1776,9 +1843,7 @@ class CharacterController(BaseController):
         with self._session as session:
             try:
 
-                config = ConfigParser()
-                config.read("config.cfg")
-                datetime_format = config.get("formats", "datetime")
+                datetime_format = self._config.get("formats", "datetime")
 
                 character_image = session.query(CharacterImage).filter(
                     CharacterImage.id == image_id,
@@ -1897,6 +1962,10 @@ class CharacterController(BaseController):
                         sibling.is_default = False
                         sibling.modified = datetime.now()
 
+                    # clear the current default before setting the new one,
+                    # or the unique default image index may reject the update
+                    session.flush()
+
                 character_image.is_default = is_default
                 character_image.modified = datetime.now()
 
@@ -1937,9 +2006,7 @@ class CharacterController(BaseController):
         with self._session as session:
             try:
 
-                config = ConfigParser()
-                config.read("config.cfg")
-                datetime_format = config.get("formats", "datetime")
+                datetime_format = self._config.get("formats", "datetime")
 
                 character_image = session.query(CharacterImage).filter(
                     CharacterImage.id == image_id,
@@ -2021,14 +2088,13 @@ class CharacterController(BaseController):
         """
 
         with self._session as session:
-            for character_image in session.query(CharacterImage).filter(
+            yield from session.query(Image).join(
+                CharacterImage, Image.id == CharacterImage.image_id
+            ).filter(
                 CharacterImage.character_id == character_id,
-                    CharacterImage.user_id == self._owner.id
-            ).order_by(CharacterImage.position).all():
-                yield session.query(Image).filter(
-                    Image.id == character_image.image_id,
-                    Image.user_id == self._owner.id
-                ).first()
+                CharacterImage.user_id == self._owner.id,
+                Image.user_id == self._owner.id
+            ).order_by(CharacterImage.position).all()
 
     def get_images_page_by_character_id(
         self, character_id: int, page: int, per_page: int
@@ -2054,13 +2120,12 @@ class CharacterController(BaseController):
 
         with self._session as session:
             offset = (page - 1) * per_page
-            for character_image in session.query(CharacterImage).filter(
+            yield from session.query(Image).join(
+                CharacterImage, Image.id == CharacterImage.image_id
+            ).filter(
                 CharacterImage.character_id == character_id,
-                    CharacterImage.user_id == self._owner.id
+                CharacterImage.user_id == self._owner.id,
+                Image.user_id == self._owner.id
             ).order_by(
                 CharacterImage.position
-            ).offset(offset).limit(per_page).all():
-                yield session.query(Image).filter(
-                    Image.id == character_image.image_id,
-                    Image.user_id == self._owner.id
-                ).first()
+            ).offset(offset).limit(per_page).all()
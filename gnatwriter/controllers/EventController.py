@@ -315,13 +315,12 @@ class EventController(BaseController):
         """
 
         with self._session as session:
-            for character_event in session.query(CharacterEvent).filter(
+            yield from session.query(Character).join(
+                CharacterEvent, Character.id == CharacterEvent.character_id
+            ).filter(
                 CharacterEvent.event_id == event_id,
-                    CharacterEvent.user_id == self._owner.id
-            ).all():
-                yield session.query(Character).filter(
-                    Character.id == character_event.character_id
-                ).first()
+                CharacterEvent.user_id == self._owner.id
+            ).all()
 
     def get_characters_page_by_event_id(
         self, event_id: int, page: int, per_page: int
@@ -345,14 +344,13 @@ class EventController(BaseController):
 
         with self._session as session:
             offset = (page - 1) * per_page
-            for character_event in session.query(CharacterEvent).filter(
+            yield from session.query(Character).join(
+                CharacterEvent, Character.id == CharacterEvent.character_id
+            ).filter(
                 CharacterEvent.event_id == event_id,
-                CharacterEvent.user_id == self._owner.id
-            ).offset(offset).limit(per_page).all():
-                yield session.query(Character).filter(
-                    Character.id == character_event.character_id,
-                    Character.user_id == self._owner.id
-                ).first()
+                CharacterEvent.user_id == self._owner.id,
+                Character.user_id == self._owner.id
+            ).offset(offset).limit(per_page).all()
 
     def append_links_to_event(
         self, event_id: int, link_ids: list
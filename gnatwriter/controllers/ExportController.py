@@ -134,47 +134,52 @@ class ExportController(BaseController):
             story_file = f"{story_folder}/story.txt"
             dict_story = story.serialize()
 
-            with open(story_file, "w") as output:
+            # the whole tree is assembled in memory and written in one call
+            # instead of one write per title, description, and scene
+            parts = [
+                f"{dict_story['title']}\n", f"{dict_story['description']}\n"
+            ]
+
+            author_count = len(dict_story["authors"])
 
-                output.write(f"{dict_story['title']}\n")
-                output.write(f"{dict_story['description']}\n")
+            counter = 0
+            is_first = True
+            author_string = ""
 
-                author_count = len(dict_story["authors"])
+            for author in dict_story["authors"]:
 
-                counter = 0
-                is_first = True
-                author_string = ""
+                counter += 1
 
-                for author in dict_story["authors"]:
+                if is_first:
+                    author_string += f"By {author['name']}"
+                    is_first = False
 
-                    counter += 1
+                elif counter == (author_count - 2):
+                    author_string += f", {author.name}"
 
-                    if is_first:
-                        author_string += f"By {author['name']}"
-                        is_first = False
+                elif counter == (author_count - 1):
+                    author_string += f" and {author.name}"
 
-                    elif counter == (author_count - 2):
-                        author_string += f", {author.name}"
+            parts.append(f"{author_string}\n")
 
-                    elif counter == (author_count - 1):
-                        author_string += f" and {author.name}"
+            for chapter in dict_story["chapters"]:
 
-                output.write(f"{author_string}\n")
+                parts.append(f"\n\n{chapter['title']}\n\n")
 
-                for chapter in dict_story["chapters"]:
+                if chapter['description']:
+                    parts.append(f"\n\n{chapter['description']}\n\n")
 
-                    output.write(f"\n\n{chapter['title']}\n\n")
+                for scene in chapter["scenes"]:
 
-                    if chapter['description']:
-                        output.write(f"\n\n{chapter['description']}\n\n")
+                    if chapter['title']:
+                        parts.append(f"{scene['title']}\n")
 
-                    for scene in chapter["scenes"]:
+                    if scene['content']:
+                        parts.append(f"{scene['content']}\n")
 
-                        if chapter['title']:
-                            output.write(f"{scene['title']}\n")
+            with open(story_file, "w") as output:
 
-                        if scene['content']:
-                            output.write(f"{scene['content']}\n")
+                output.write("".join(parts))
 
         with self._session as session:
 
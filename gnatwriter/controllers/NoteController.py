@@ -2,13 +2,10 @@ from configparser import ConfigParser
 from datetime import datetime
 from typing import Type, List
 
-from gnatwriter.models.NoteStory import NoteStory
-
-from gnatwriter.models.Story import Story
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from gnatwriter.controllers.BaseController import BaseController
-from gnatwriter.models import User, Note, Activity
+from gnatwriter.models import User, Note, Activity, NoteStory, Story
 
 
 class NoteController(BaseController):
@@ -235,7 +232,7 @@ class NoteController(BaseController):
         with self._session as session:
             offset = (page - 1) * per_page
             return session.query(Note).filter(
-                Note.owner_id == self._owner.id
+                Note.user_id == self._owner.id
             ).offset(offset).limit(per_page).all()
 
     def search_notes(self, search: str) -> List[Type[Note]]:
@@ -1,4 +1,3 @@
-import os
 from configparser import ConfigParser
 from datetime import datetime
 from typing import Type, List
@@ -209,10 +208,6 @@ class SceneController(BaseController):
             The new position value
         """
 
-        config = ConfigParser()
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        config.read(f"{project_root}/config.cfg")
-
         with self._session as session:
             try:
                 scene = session.query(Scene).filter(
@@ -237,7 +232,7 @@ class SceneController(BaseController):
                         sibling.position += 1
                         sibling.created = datetime.strptime(
                             str(sibling.created),
-                            config.get("formats", "datetime")
+                            self._config.get("formats", "datetime")
                         )
                         sibling.modified = datetime.now()
                 else:
@@ -251,7 +246,7 @@ class SceneController(BaseController):
                         sibling.position -= 1
                         sibling.created = datetime.strptime(
                             str(sibling.created),
-                            config.get("formats", "datetime")
+                            self._config.get("formats", "datetime")
                         )
                         sibling.modified = datetime.now()
 
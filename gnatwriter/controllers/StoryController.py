@@ -1,11 +1,37 @@
+import re
 from configparser import ConfigParser
 from datetime import datetime
-from typing import Type, List
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from typing import Type, List, Tuple, Iterator
+from sqlalchemy import or_, text, select, bindparam, insert, func, Row, true
+from sqlalchemy.orm import Session, selectinload
 from gnatwriter.controllers.BaseController import BaseController
 from gnatwriter.models import User, Story, Author, AuthorStory, Chapter, Activity, Character, CharacterStory, Link, \
-    LinkStory, Note, NoteStory
+    LinkStory, Note, NoteStory, Scene
+
+MAX_SEARCH_RESULTS = 1000
+
+
+def _story_tree_options() -> tuple:
+    """Loader options that fetch a story's whole chapter and scene tree
+
+    Each level of the hierarchy is loaded with one SELECT ... IN query rather
+    than one query per parent.
+    """
+
+    chapters = selectinload(Story.chapters)
+    scenes = chapters.selectinload(Chapter.scenes)
+
+    return (
+        selectinload(Story.authors),
+        selectinload(Story.links),
+        selectinload(Story.notes),
+        selectinload(Story.references),
+        selectinload(Story.submissions),
+        chapters.selectinload(Chapter.links),
+        chapters.selectinload(Chapter.notes),
+        scenes.selectinload(Scene.links),
+        scenes.selectinload(Scene.notes)
+    )
 
 
 class StoryController(BaseController):
@@ -26,6 +52,8 @@ class StoryController(BaseController):
     -------
     create_story(title: str, description: str)
         Create a new story
+    create_stories_bulk(items: list)
+        Create many stories in a single statement
     update_story(story_id: int, title: str, description: str)
         Update a story
     delete_story(story_id: int)
@@ -34,14 +62,28 @@ class StoryController(BaseController):
         Check if a user has stories
     count_stories()
         Count the number of stories associated with a user
+    estimate_story_count()
+        Estimate the total number of stories in the database
     get_story_by_id(story_id: int)
         Get a story by id
+    get_story_by_id_full(story_id: int)
+        Get a story by id with its chapters and scenes loaded
+    serialize_story(story_id: int)
+        Get the dictionary representation of a story and its whole tree
     get_all_stories()
         Get all stories associated with an owner
+    get_all_stories_with_tree()
+        Get all stories of an owner with their chapters and scenes loaded
+    get_all_story_summaries()
+        Get the id, title, and modified date of all stories of an owner
     get_all_stories_page(page: int, per_page: int)
         Get a single page of stories associated with an owner from the database
+    get_stories_page_with_next(page: int, per_page: int)
+        Get a single page of stories and whether another page follows it
     search_stories(search: str)
         Search for stories by title and description
+    iter_search_stories(search: str, batch_size: int)
+        Search for stories by title and description, streaming the results
     append_authors_to_story(story_id: int, author_ids: list)
         Append authors to a story
     detach_authors_from_story(story_id:int, author_ids: list)
@@ -111,13 +153,12 @@ class StoryController(BaseController):
                     created=created, modified=modified
                 )
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Story {story.title[:50]} \
-                    created by {self._owner.username}', created=datetime.now()
-                )
+                    created by {self._owner.username}', created=created
+                ))
 
                 session.add(story)
-                session.add(activity)
 
             except Exception as e:
                 session.rollback()
@@ -127,6 +168,58 @@ class StoryController(BaseController):
                 session.commit()
                 return story
 
+    def create_stories_bulk(self, items: List[dict]) -> int:
+        """Create many stories in a single statement
+
+        The rows are written with one multi-row INSERT instead of one ORM
+        flush per story, and a single activity is logged for the whole batch.
+
+        Parameters
+        ----------
+        items : list
+            A list of dictionaries, each with a title and an optional
+            description
+
+        Returns
+        -------
+        int
+            The number of stories created
+        """
+
+        if not items:
+            return 0
+
+        with self._session as session:
+            try:
+                created = datetime.now()
+                rows = []
+
+                for item in items:
+                    rows.append({
+                        'user_id': self._owner.id,
+                        'title': Story.check_title(item.get('title')),
+                        'description': Story.check_description(
+                            item.get('description')
+                        ),
+                        'created': created,
+                        'modified': created
+                    })
+
+                session.execute(insert(Story), rows)
+
+                session.execute(insert(Activity).values(
+                    user_id=self._owner.id, summary=f'{len(rows)} stories \
+                    created by {self._owner.username}', created=created
+                ))
+
+            except Exception as e:
+                session.rollback()
+                raise e
+
+            else:
+                session.commit()
+                return len(rows)
+
     def update_story(
         self, story_id: int, title: str, description: str = None
     ) -> Type[Story]:
@@ -149,24 +242,20 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
                 story.title = title
                 story.description = description
-                story.modified = datetime.now()
+                modified = datetime.now()
+                story.modified = modified
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Story {story.id} updated \
-                    by {self._owner.username}', created=datetime.now()
-                )
-
-                session.add(activity)
+                    by {self._owner.username}', created=modified
+                ))
 
             except Exception as e:
                 session.rollback()
@@ -192,21 +281,17 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Story {story.id} deleted \
                     by {self._owner.username}', created=datetime.now()
-                )
+                ))
 
                 session.delete(story)
-                session.add(activity)
 
             except Exception as e:
                 session.rollback()
@@ -225,11 +310,11 @@ class StoryController(BaseController):
             True if the user has stories
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Story).filter(
+            return session.query(Story.id).filter(
                 Story.user_id == self._owner.id
-            ).count() > 0
+            ).first() is not None
 
     def count_stories(self) -> int:
         """Count the number of stories associated with a user
@@ -240,11 +325,23 @@ class StoryController(BaseController):
             The number of stories
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Story).filter(
+            return session.query(func.count(Story.id)).filter(
                 Story.user_id == self._owner.id
-            ).count()
+            ).scalar()
+
+    def estimate_story_count(self) -> int:
+        """Estimate the total number of stories in the database
+
+        Returns
+        -------
+        int
+            The approximate number of stories
+        """
+
+        with self._readonly_session() as session:
+            return self._estimate_row_count(session, Story)
 
     def get_story_by_id(self, story_id: int) -> Type[Story] | None:
         """Get a story by id
@@ -260,12 +357,56 @@ class StoryController(BaseController):
             The story object
         """
 
-        with self._session as session:
-            story = session.query(Story).filter(
-                Story.id == story_id,
-                Story.user_id == self._owner.id
+        with self._readonly_session() as session:
+            story = session.get(Story, story_id)
+
+            if story and story.user_id == self._owner.id:
+                return story
+
+            return None
+
+    def get_story_by_id_full(self, story_id: int) -> Type[Story] | None:
+        """Get a story by id with its chapters and scenes loaded
+
+        Parameters
+        ----------
+        story_id : int
+            The id of the story
+
+        Returns
+        -------
+        Story
+            The story object
+        """
+
+        with self._readonly_session() as session:
+            return session.scalars(
+                select(Story).where(
+                    Story.id == story_id,
+                    Story.user_id == self._owner.id
+                ).options(*_story_tree_options())
             ).first()
-            return story
+
+    def serialize_story(self, story_id: int) -> dict | None:
+        """Get the dictionary representation of a story and its whole tree
+
+        Parameters
+        ----------
+        story_id : int
+            The id of the story
+
+        Returns
+        -------
+        dict
+            The serialized story
+        """
+
+        story = self.get_story_by_id_full(story_id)
+
+        if story is None:
+            return None
+
+        return story.serialize()
 
     def get_all_stories(self) -> List[Type[Story]]:
         """Get all stories associated with an owner
@@ -276,11 +417,52 @@ class StoryController(BaseController):
             A list of story objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(Story).filter(
                 Story.user_id == self._owner.id
             ).all()
 
+    def get_all_stories_with_tree(self) -> List[Type[Story]]:
+        """Get all stories of an owner with their chapters and scenes loaded
+
+        Each level of the story, chapter, and scene hierarchy is loaded with
+        one SELECT ... IN query rather than one query per parent, so the
+        whole tree can be traversed on the returned objects without any
+        further round trips.
+
+        Returns
+        -------
+        list
+            A list of story objects
+        """
+
+        with self._readonly_session() as session:
+            return session.scalars(
+                select(Story).where(
+                    Story.user_id == self._owner.id
+                ).order_by(Story.id).options(*_story_tree_options())
+            ).all()
+
+    def get_all_story_summaries(self) -> List[Row]:
+        """Get the id, title, and modified date of all stories of an owner
+
+        Only the three columns are selected, so list views skip hydrating
+        full Story objects, their eager-loaded collections, and the potentially
+        large description column.
+
+        Returns
+        -------
+        list
+            A list of (id, title, modified) rows ordered by title
+        """
+
+        with self._readonly_session() as session:
+            return session.execute(
+                select(Story.id, Story.title, Story.modified).where(
+                    Story.user_id == self._owner.id
+                ).order_by(Story.title)
+            ).all()
+
     def get_all_stories_page(
         self, page: int, per_page: int
     ) -> List[Type[Story]]:
@@ -299,15 +481,104 @@ class StoryController(BaseController):
             A list of story objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             offset = (page - 1) * per_page
             return session.query(Story).filter(
                 Story.user_id == self._owner.id
             ).offset(offset).limit(per_page).all()
 
+    def get_stories_page_with_next(
+        self, page: int, per_page: int
+    ) -> Tuple[List[Type[Story]], bool]:
+        """Get a single page of stories and whether another page follows it
+
+        One extra row is fetched and trimmed off, which tells the caller if
+        there is a next page without a separate COUNT query.
+
+        Parameters
+        ----------
+        page : int
+            The page number
+        per_page : int
+            The number of rows per page
+
+        Returns
+        -------
+        tuple
+            A list of story objects and True if there is a next page
+        """
+
+        with self._readonly_session() as session:
+            offset = (page - 1) * per_page
+            stories = session.query(Story).filter(
+                Story.user_id == self._owner.id
+            ).order_by(Story.id).offset(offset).limit(per_page + 1).all()
+
+            return stories[:per_page], len(stories) > per_page
+
+    def _search_criteria(self, session: Session, search: str):
+        """Build the full-text match clause for the session's database backend
+
+        The search is split into words, and a story matches when its title or
+        description holds every word, or a word starting with it. A search
+        without any words matches every story.
+
+        Parameters
+        ----------
+        session : Session
+            The database session
+        search : str
+            The search string
+
+        Returns
+        -------
+        ColumnElement
+            The criteria matching stories by title and description
+        """
+
+        terms = re.findall(r"\w+", search)
+
+        if not terms:
+            return true()
+
+        dialect = session.get_bind().dialect.name
+
+        if dialect == "postgresql":
+            return text(
+                "to_tsvector('english', stories.title || ' ' || "
+                "coalesce(stories.description, '')) @@ "
+                "to_tsquery('english', :search)"
+            ).bindparams(search=" & ".join(f"{term}:*" for term in terms))
+
+        if dialect == "mysql":
+            return text(
+                "MATCH (stories.title, stories.description) "
+                "AGAINST (:search IN BOOLEAN MODE)"
+            ).bindparams(search=" ".join(f"+{term}*" for term in terms))
+
+        if dialect == "sqlite":
+            return Story.id.in_(
+                text(
+                    "SELECT rowid FROM stories_fts WHERE stories_fts MATCH :search"
+                ).bindparams(
+                    search=" ".join(f'"{term}"*' for term in terms)
+                ).columns(Story.id)
+            )
+
+        return or_(
+            Story.title.like(f'%{search}%'),
+            Story.description.like(f'%{search}%')
+        )
+
     def search_stories(self, search: str) -> List[Type[Story]]:
         """Search for stories by title and description
 
+        The search uses the full-text index of the database backend: a GIN
+        tsvector index on PostgreSQL, a FULLTEXT index on MySQL, and an FTS5
+        shadow table on SQLite. Stories match on whole words and word prefixes,
+        so "tale" finds "Dragon tales", but a fragment from inside a word such
+        as "agon" does not. At most MAX_SEARCH_RESULTS stories are returned.
+
         Parameters
         ----------
         search : str
@@ -319,14 +590,47 @@ class StoryController(BaseController):
             A list of story objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(Story).filter(
-                or_(
-                    Story.title.like(f'%{search}%'),
-                    Story.description.like(f'%{search}%')
-                ),
+                self._search_criteria(session, search),
                 Story.user_id == self._owner.id
-            ).all()
+            ).order_by(Story.id).limit(MAX_SEARCH_RESULTS).all()
+
+    def iter_search_stories(
+        self, search: str, batch_size: int = 200
+    ) -> Iterator[Story]:
+        """Search for stories by title and description, streaming the results
+
+        Rows are fetched batch_size at a time, through a server-side cursor
+        where the driver supports one, so memory use is bounded by the batch
+        rather than by the size of the result. Collections are loaded with
+        one SELECT ... IN per batch instead of joined eager loading, which
+        cannot be combined with yield_per. The rows are read through a session
+        of their own, so other controller calls can be made while iterating.
+
+        Parameters
+        ----------
+        search : str
+            The search string
+        batch_size : int
+            The number of rows fetched per round trip
+
+        Returns
+        -------
+        Iterator
+            An iterator of story objects
+        """
+
+        with self._private_session() as session:
+            stmt = select(Story).where(
+                self._search_criteria(session, search),
+                Story.user_id == self._owner.id
+            ).order_by(Story.id).limit(MAX_SEARCH_RESULTS).options(
+                selectinload('*')
+            ).execution_options(yield_per=batch_size)
+
+            for story in session.scalars(stmt):
+                yield story
 
     def append_authors_to_story(
         self, story_id: int, author_ids: list
@@ -348,44 +652,48 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                created = datetime.now()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
-                for author_id in author_ids:
-                    author = session.query(Author).filter(
-                        Author.id == author_id,
+                summary = f'Authors appended to story {story.title[:50]} by \
+                {self._owner.username}'
+                author_ids = list(dict.fromkeys(author_ids))
+                owned_ids = set(session.scalars(
+                    select(Author.id).where(
+                        Author.id.in_(author_ids),
                         Author.user_id == self._owner.id
-                    ).first()
+                    )
+                ))
 
-                    if not author:
-                        raise ValueError('Author not found.')
+                if len(owned_ids) != len(author_ids):
+                    raise ValueError('Author not found.')
 
-                    author_story = session.query(AuthorStory).filter(
+                linked_ids = set(session.scalars(
+                    select(AuthorStory.author_id).where(
                         AuthorStory.user_id == self._owner.id,
-                        AuthorStory.author_id == author_id,
+                        AuthorStory.author_id.in_(author_ids),
                         AuthorStory.story_id == story_id
-                    ).first()
-
-                    if not author_story:
-
-                        author_story = AuthorStory(
-                            user_id=self._owner.id, author_id=author_id,
-                            story_id=story_id, created=datetime.now()
-                        )
-                        story.authors.append(author_story)
-
-                        activity = Activity(
-                            user_id=self._owner.id, summary=f'Authors appended to \
-                            story {story.title[:50]} by {self._owner.username}',
-                            created=datetime.now()
-                        )
-
-                        session.add(activity)
+                    )
+                ))
+                # the links are written with one multi-row INSERT instead
+                # of one ORM flush per author
+                rows = [
+                    {
+                        'user_id': self._owner.id, 'author_id': author_id,
+                        'story_id': story_id, 'created': created
+                    }
+                    for author_id in author_ids if author_id not in linked_ids
+                ]
+
+                if rows:
+                    session.execute(insert(AuthorStory), rows)
+                    session.execute(insert(Activity).values(
+                        user_id=self._owner.id, summary=summary,
+                        created=created
+                    ))
 
             except Exception as e:
                 session.rollback()
@@ -393,6 +701,10 @@ class StoryController(BaseController):
 
             else:
                 session.commit()
+
+                if rows:
+                    session.refresh(story, ['authors'])
+
                 return story
 
     def detach_authors_from_story(
@@ -415,40 +727,46 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                created = datetime.now()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
+                author_stmt = select(Author).where(
+                    Author.id == bindparam('author_id'),
+                    Author.user_id == self._owner.id
+                )
+                author_story_stmt = select(AuthorStory).where(
+                    AuthorStory.user_id == self._owner.id,
+                    AuthorStory.author_id == bindparam('author_id'),
+                    AuthorStory.story_id == story_id
+                )
+
+                summary = f'Authors detached from story {story.title[:50]} by \
+                {self._owner.username}'
+
                 for author_id in author_ids:
-                    author = session.query(Author).filter(
-                        Author.id == author_id,
-                        Author.user_id == self._owner.id
+                    author = session.scalars(
+                        author_stmt, {'author_id': author_id}
                     ).first()
 
                     if not author:
                         raise ValueError('Author not found.')
 
-                    author_story = session.query(AuthorStory).filter(
-                        AuthorStory.user_id == self._owner.id,
-                        AuthorStory.author_id == author_id,
-                        AuthorStory.story_id == story_id
+                    author_story = session.scalars(
+                        author_story_stmt, {'author_id': author_id}
                     ).first()
 
                     if not author_story:
                         return story
 
-                    activity = Activity(
-                        user_id=self._owner.id, summary=f'Authors detached from \
-                        story {story.title[:50]} by {self._owner.username}',
-                        created=datetime.now()
-                    )
+                    session.execute(insert(Activity).values(
+                        user_id=self._owner.id, summary=summary,
+                        created=created
+                    ))
 
                     session.delete(author_story)
-                    session.add(activity)
 
             except Exception as e:
                 session.rollback()
@@ -472,12 +790,12 @@ class StoryController(BaseController):
             True if the story has authors
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Author).join(AuthorStory).filter(
+            return session.query(AuthorStory.author_id).filter(
                 AuthorStory.story_id == story_id,
                 AuthorStory.user_id == self._owner.id
-            ).count() > 0
+            ).first() is not None
 
     def get_authors_by_story_id(self, story_id: int) -> List[Type[Author]]:
         """Get all authors associated with a story
@@ -493,7 +811,7 @@ class StoryController(BaseController):
             A list of author objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(Author).join(AuthorStory).filter(
                 AuthorStory.story_id == story_id,
                 AuthorStory.user_id == self._owner.id
@@ -513,12 +831,12 @@ class StoryController(BaseController):
             True if the story has chapters
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Chapter).filter(
+            return session.query(Chapter.id).filter(
                 Chapter.story_id == story_id,
                 Chapter.user_id == self._owner.id
-            ).count() > 0
+            ).first() is not None
 
     def get_chapter_by_position(
         self, story_id: int, position: int
@@ -538,7 +856,7 @@ class StoryController(BaseController):
             The chapter object
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
             return session.query(Chapter).filter(
                 Chapter.story_id == story_id,
@@ -562,7 +880,7 @@ class StoryController(BaseController):
             A list of chapter objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
             return session.query(Chapter).filter(
                 Chapter.story_id == story_id,
@@ -590,38 +908,41 @@ class StoryController(BaseController):
         with self._session as session:
 
             try:
+                created = datetime.now()
 
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
+                character_stmt = select(Character).where(
+                    Character.id == bindparam('character_id'),
+                    Character.user_id == self._owner.id
+                )
+
+                rows = []
+
                 for character_id in character_ids:
-                    character = session.query(Character).filter(
-                        Character.id == character_id,
-                        Character.user_id == self._owner.id
+                    character = session.scalars(
+                        character_stmt, {'character_id': character_id}
                     ).first()
 
                     if not character:
                         raise ValueError('Character not found.')
 
-                    character_story = CharacterStory(
-                        user_id=self._owner.id, character_id=character_id,
-                        story_id=story_id, created=datetime.now()
-                    )
+                    rows.append({
+                        'user_id': self._owner.id, 'character_id': character_id,
+                        'story_id': story_id, 'created': created
+                    })
 
-                    story.characters.append(character_story)
+                if rows:
+                    session.execute(insert(CharacterStory), rows)
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Characters appended to \
                     story {story.title[:50]} by {self._owner.username}',
-                    created=datetime.now()
-                )
-
-                session.add(activity)
+                    created=created
+                ))
 
             except Exception as e:
                 session.rollback()
@@ -629,6 +950,7 @@ class StoryController(BaseController):
 
             else:
                 session.commit()
+                session.refresh(story, ['characters'])
                 return story
 
     def has_characters(self, story_id: int) -> bool:
@@ -645,11 +967,12 @@ class StoryController(BaseController):
             True if the story has characters
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Character).join(CharacterStory).filter(
-                CharacterStory.story_id == story_id, Character
-            ).count() > 0
+            return session.query(CharacterStory.character_id).filter(
+                CharacterStory.story_id == story_id,
+                CharacterStory.user_id == self._owner.id
+            ).first() is not None
 
     def get_characters_by_story_id(
         self, story_id: int
@@ -667,10 +990,11 @@ class StoryController(BaseController):
             A list of character objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
             return session.query(Character).join(CharacterStory).filter(
-                CharacterStory.story_id == story_id, Character
+                CharacterStory.story_id == story_id,
+                CharacterStory.user_id == self._owner.id
             ).all()
 
     def get_characters_page_by_story_id(
@@ -693,12 +1017,13 @@ class StoryController(BaseController):
             A list of character objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
             offset = (page - 1) * per_page
 
             return session.query(Character).join(CharacterStory).filter(
-                CharacterStory.story_id == story_id, Character
+                CharacterStory.story_id == story_id,
+                CharacterStory.user_id == self._owner.id
             ).offset(offset).limit(per_page).all()
 
     def append_links_to_story(
@@ -721,37 +1046,40 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                created = datetime.now()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
+                link_stmt = select(Link).where(
+                    Link.id == bindparam('link_id'),
+                    Link.user_id == self._owner.id
+                )
+
+                rows = []
+
                 for link_id in link_ids:
-                    link = session.query(Link).filter(
-                        Link.id == link_id,
-                        Link.user_id == self._owner.id
+                    link = session.scalars(
+                        link_stmt, {'link_id': link_id}
                     ).first()
 
                     if not link:
                         raise ValueError('Link not found.')
 
-                    link_story = LinkStory(
-                        user_id=self._owner.id, story_id=story_id,
-                        link_id=link_id, created=datetime.now()
-                    )
+                    rows.append({
+                        'user_id': self._owner.id, 'link_id': link_id,
+                        'story_id': story_id, 'created': created
+                    })
 
-                    story.links.append(link_story)
+                if rows:
+                    session.execute(insert(LinkStory), rows)
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Links appended to story \
                     {story.title[:50]} by {self._owner.username}',
-                    created=datetime.now()
-                )
-
-                session.add(activity)
+                    created=created
+                ))
 
             except Exception as e:
                 session.rollback()
@@ -759,6 +1087,7 @@ class StoryController(BaseController):
 
             else:
                 session.commit()
+                session.refresh(story, ['links'])
                 return story
 
     def has_links(self, story_id: int) -> bool:
@@ -775,10 +1104,11 @@ class StoryController(BaseController):
             True if the story has links
         """
 
-        with self._session as session:
-            return session.query(Link).join(LinkStory).filter(
-                LinkStory.story_id == story_id, LinkStory
-            ).count() > 0
+        with self._readonly_session() as session:
+            return session.query(LinkStory.link_id).filter(
+                LinkStory.story_id == story_id,
+                LinkStory.user_id == self._owner.id
+            ).first() is not None
 
     def get_links_by_story_id(self, story_id: int) -> List[Type[Link]]:
         """Get all links associated with a story
@@ -794,7 +1124,7 @@ class StoryController(BaseController):
             A list of link objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(Link).join(LinkStory).filter(
                 LinkStory.story_id == story_id,
                 LinkStory.user_id == self._owner.id
@@ -820,37 +1150,40 @@ class StoryController(BaseController):
 
         with self._session as session:
             try:
-                story = session.query(Story).filter(
-                    Story.id == story_id,
-                    Story.user_id == self._owner.id
-                ).first()
+                created = datetime.now()
+                story = session.get(Story, story_id)
 
-                if not story:
+                if not story or story.user_id != self._owner.id:
                     raise ValueError('Story not found.')
 
+                note_stmt = select(Note).where(
+                    Note.id == bindparam('note_id'),
+                    Note.user_id == self._owner.id
+                )
+
+                rows = []
+
                 for note_id in note_ids:
-                    note = session.query(Note).filter(
-                        Note.id == note_id,
-                        Note.user_id == self._owner.id
+                    note = session.scalars(
+                        note_stmt, {'note_id': note_id}
                     ).first()
 
                     if not note:
                         raise ValueError('Note not found.')
 
-                    note_story = NoteStory(
-                        user_id=self._owner.id, story_id=story_id,
-                        note_id=note_id, created=datetime.now()
-                    )
+                    rows.append({
+                        'user_id': self._owner.id, 'note_id': note_id,
+                        'story_id': story_id, 'created': created
+                    })
 
-                    story.notes.append(note_story)
+                if rows:
+                    session.execute(insert(NoteStory), rows)
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=self._owner.id, summary=f'Notes appended to story \
                     {story.title[:50]} by {self._owner.username}',
-                    created=datetime.now()
-                )
-
-                session.add(activity)
+                    created=created
+                ))
 
             except Exception as e:
                 session.rollback()
@@ -858,6 +1191,7 @@ class StoryController(BaseController):
 
             else:
                 session.commit()
+                session.refresh(story, ['notes'])
                 return story
 
     def has_notes(self, story_id: int) -> bool:
@@ -874,11 +1208,12 @@ class StoryController(BaseController):
             True if the story has notes
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
 
-            return session.query(Note).join(NoteStory).filter(
-                NoteStory.story_id == story_id, NoteStory
-            ).count() > 0
+            return session.query(NoteStory.note_id).filter(
+                NoteStory.story_id == story_id,
+                NoteStory.user_id == self._owner.id
+            ).first() is not None
 
     def get_notes_by_story_id(self, story_id: int) -> List[Type[Note]]:
         """Get all notes associated with a story
@@ -894,7 +1229,7 @@ class StoryController(BaseController):
             A list of note objects
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(Note).join(NoteStory).filter(
                 NoteStory.story_id == story_id,
                 NoteStory.user_id == self._owner.id
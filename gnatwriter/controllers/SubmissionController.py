@@ -83,22 +83,22 @@ class SubmissionController(BaseController):
             try:
 
                 if date_sent:
-                    date_sent = datetime.strptime(date_sent, '%Y-%m-%d').date()
+                    date_sent = date.fromisoformat(date_sent)
                 else:
                     date_sent = None
 
                 if date_reply_received:
-                    date_reply_received = datetime.strptime(date_reply_received, '%Y-%m-%d').date()
+                    date_reply_received = date.fromisoformat(date_reply_received)
                 else:
                     date_reply_received = None
 
                 if date_published:
-                    date_published = datetime.strptime(date_published, '%Y-%m-%d').date()
+                    date_published = date.fromisoformat(date_published)
                 else:
                     date_published = None
 
                 if date_paid:
-                    date_paid = datetime.strptime(date_paid, '%Y-%m-%d').date()
+                    date_paid = date.fromisoformat(date_paid)
                 else:
                     date_paid = None
 
@@ -184,22 +184,22 @@ class SubmissionController(BaseController):
                 submission.submitted_to = submitted_to
 
                 if date_sent:
-                    submission.date_sent = datetime.strptime(date_sent, '%Y-%m-%d').date()
+                    submission.date_sent = date.fromisoformat(date_sent)
                 else:
                     submission.date_sent = None
 
                 if date_reply_received:
-                    submission.date_reply_received = datetime.strptime(date_reply_received, '%Y-%m-%d').date()
+                    submission.date_reply_received = date.fromisoformat(date_reply_received)
                 else:
                     submission.date_reply_received = None
 
                 if date_published:
-                    submission.date_published = datetime.strptime(date_published, '%Y-%m-%d').date()
+                    submission.date_published = date.fromisoformat(date_published)
                 else:
                     submission.date_published = None
 
                 if date_paid:
-                    submission.date_paid = datetime.strptime(date_paid, '%Y-%m-%d').date()
+                    submission.date_paid = date.fromisoformat(date_paid)
                 else:
                     submission.date_paid = None
 
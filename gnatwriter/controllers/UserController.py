@@ -1,10 +1,11 @@
 import uuid
 from configparser import ConfigParser
 from datetime import datetime
-from typing import Type, List
+from typing import Type, List, Iterator
 import bcrypt
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, or_, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
 from gnatwriter.controllers.BaseController import BaseController
 from gnatwriter.models import User, Activity
 
@@ -74,12 +75,20 @@ class UserController(BaseController):
         Get a user by email
     get_user_count()
         Get user count
+    estimate_user_count()
+        Estimate the total number of users in the database
     get_all_users()
         Get all users
+    iter_all_users(batch_size: int)
+        Get all users, streaming the results
     get_all_users_page(page: int, per_page: int)
         Get a single page of users from the database
+    get_users_page_after(after_id: int | None, per_page: int)
+        Get the page of users that follows the given user id
     search_users(search: str)
         Search for users by username or email
+    search_users_by_prefix(prefix: str)
+        Search for users whose username or email starts with a prefix
     """
 
     def __init__(
@@ -112,37 +121,27 @@ class UserController(BaseController):
             The new user object
         """
 
+        # Hashing is deliberately slow, so do it before the session checks out
+        # a connection rather than while the transaction holds one open
+        password = hash_password(password)
+
         with self._session as session:
 
             try:
 
-                username_exists = session.query(User).filter(
-                    User.username == username
-                ).first()
+                existing = session.execute(
+                    select(User.username, User.email).where(
+                        or_(User.username == username, User.email == email)
+                    )
+                ).all()
 
-                if username_exists:
+                if any(row.username == username for row in existing):
                     raise Exception('That username already exists.')
 
-                email_exists = session.query(User).filter(
-                    User.email == email
-                ).first()
-
-                if email_exists:
+                if any(row.email == email for row in existing):
                     raise Exception('That email already exists.')
 
                 uuid4 = str(uuid.uuid4())
-                uuid_exists = session.query(User).filter(
-                    User.uuid == uuid4
-                ).first()
-
-                while uuid_exists:
-
-                    uuid4 = str(uuid.uuid4())
-                    uuid_exists = session.query(User).filter(
-                        User.uuid == uuid4
-                    ).first()
-
-                password = hash_password(password)
                 created = datetime.now()
                 modified = created
 
@@ -154,12 +153,23 @@ class UserController(BaseController):
 
                 activity = Activity(
                     user_id=self._owner.id, summary=f'User {user.username} \
-                    created by {self._owner.username}', created=datetime.now()
+                    created by {self._owner.username}', created=created
                 )
 
                 session.add(user)
                 session.add(activity)
 
+                try:
+                    session.flush()
+
+                except IntegrityError:
+                    # The uuid column is unique and a duplicate UUID4 is the
+                    # only expected collision, so retry once with a fresh one
+                    session.rollback()
+                    user.uuid = str(uuid.uuid4())
+                    session.add(user)
+                    session.add(activity)
+
             except Exception as e:
                 session.rollback()
                 raise e
@@ -198,34 +208,33 @@ class UserController(BaseController):
             The id of the new user on success
         """
 
+        if password != repassword:
+            raise Exception('The passwords do not match.')
+
+        # Hashing is deliberately slow, so do it before the session checks out
+        # a connection rather than while the transaction holds one open
+        password = hash_password(password)
+
         with self._session as session:
 
             try:
 
-                username_exists = session.query(User).filter(User.username == username).first()
+                existing = session.execute(
+                    select(User.username, User.email).where(
+                        or_(User.username == username, User.email == email)
+                    )
+                ).all()
 
-                if username_exists:
+                if any(row.username == username for row in existing):
                     raise Exception('That username already exists.')
 
                 if email != reemail:
                     raise Exception('The email addresses do not match.')
 
-                email_exists = session.query(User).filter(User.email == email).first()
-
-                if email_exists:
+                if any(row.email == email for row in existing):
                     raise Exception('That email address already exists.')
 
-                if password != repassword:
-                    raise Exception('The passwords do not match.')
-
                 uuid4 = str(uuid.uuid4())
-                uuid_exists = session.query(User).filter(User.uuid == uuid4).first()
-
-                while uuid_exists:
-                    uuid4 = str(uuid.uuid4())
-                    uuid_exists = session.query(User).filter(User.uuid == uuid4).first()
-
-                password = hash_password(password)
                 created = datetime.now()
                 modified = created
                 user = User(
@@ -234,7 +243,24 @@ class UserController(BaseController):
                     is_active=False
                 )
 
+                activity = Activity(
+                    user=user, summary=f'User {user.username} registered \
+                    by {user.username}', created=created
+                )
+
                 session.add(user)
+                session.add(activity)
+
+                try:
+                    session.flush()
+
+                except IntegrityError:
+                    # The uuid column is unique and a duplicate UUID4 is the
+                    # only expected collision, so retry once with a fresh one
+                    session.rollback()
+                    user.uuid = str(uuid.uuid4())
+                    session.add(user)
+                    session.add(activity)
 
             except Exception as e:
                 session.rollback()
@@ -242,22 +268,7 @@ class UserController(BaseController):
 
             else:
                 session.commit()
-
-                activity = Activity(
-                    user_id=user.id, summary=f'User {user.username} registered \
-                    by {user.username}', created=datetime.now()
-                )
-
-                try:
-                    session.add(activity)
-
-                except Exception as e:
-                    session.rollback()
-                    raise e
-
-                else:
-                    session.commit()
-                    return user
+                return user
 
     def activate_user(self, user_id: int) -> Type[User]:
         """Activate a user
@@ -275,17 +286,18 @@ class UserController(BaseController):
 
         with self._session as session:
 
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
 
             if not user:
                 raise ValueError('User not found.')
 
             try:
                 user.is_active = True
-                user.modified = datetime.now()
+                modified = datetime.now()
+                user.modified = modified
                 activity = Activity(
                     user_id=self._owner.id, summary=f'User {user.username} \
-                    activated by {self._owner.username}', created=datetime.now()
+                    activated by {self._owner.username}', created=modified
                 )
 
                 session.add(user)
@@ -315,18 +327,19 @@ class UserController(BaseController):
 
         with self._session as session:
 
-            user = session.query(User).filter(User.id == user_id).first()
+            user = session.get(User, user_id)
 
             if not user:
                 raise ValueError('User not found.')
 
             try:
                 user.is_active = False
-                user.modified = datetime.now()
+                modified = datetime.now()
+                user.modified = modified
                 activity = Activity(
                     user_id=self._owner.id, summary=f'User {user.username} \
                     deactivated by {self._owner.username}',
-                    created=datetime.now()
+                    created=modified
                 )
 
                 session.add(user)
@@ -343,6 +356,10 @@ class UserController(BaseController):
     def login(self, username: str, password: str) -> Type[User]:
         """User login
 
+        The credentials are checked against a narrow column select, and the
+        login activity is only written once they are verified, so a failed
+        attempt never writes to the database.
+
         Parameters
         ----------
         username : str
@@ -359,7 +376,11 @@ class UserController(BaseController):
         with self._session as session:
 
             try:
-                candidate = session.query(User).filter(User.username == username).first()
+                candidate = session.execute(
+                    select(
+                        User.id, User.username, User.password, User.is_active
+                    ).where(User.username == username)
+                ).first()
 
                 if not candidate:
                     raise Exception('User not found.')
@@ -370,12 +391,10 @@ class UserController(BaseController):
                 if not candidate.is_active:
                     raise ValueError('User account is not activated.')
 
-                activity = Activity(
+                session.execute(insert(Activity).values(
                     user_id=candidate.id, summary=f'User {candidate.username} \
                     logged in', created=datetime.now()
-                )
-
-                session.add(activity)
+                ))
 
             except Exception as e:
                 session.rollback()
@@ -383,7 +402,7 @@ class UserController(BaseController):
 
             else:
                 session.commit()
-                return candidate
+                return session.get(User, candidate.id)
 
     def change_password(
         self, user_id: int, old_password: str, new_password, repassword: str
@@ -420,26 +439,15 @@ class UserController(BaseController):
 
         new_password = hash_password(new_password)
         user.password = new_password
-        user.modified = str(datetime.now())
 
-        with self._session as session:
+        with self._session as session, session.begin():
+            session.add(user)
+            session.execute(insert(Activity).values(
+                user_id=user.id, summary=f'User {user.username} changed \
+                their password', created=datetime.now()
+            ))
 
-            try:
-                activity = Activity(
-                    user_id=user.id, summary=f'User {user.username} changed \
-                    their password', created=datetime.now()
-                )
-
-                session.add(user)
-                session.add(activity)
-
-            except Exception as e:
-                session.rollback()
-                raise e
-
-            else:
-                session.commit()
-                return user
+        return user
 
     def delete_user(self, user_id: int) -> bool:
         """Delete a user
@@ -455,29 +463,23 @@ class UserController(BaseController):
             True on success
         """
 
-        with self._session as session:
-
-            try:
-                user = session.query(User).filter(User.id == user_id).first()
+        # read the owner's columns before anything in the unit of work can
+        # expire the instance and make these lookups reload it
+        owner_id, owner_username = self._owner.id, self._owner.username
 
-                if not user:
-                    raise ValueError('User not found.')
+        with self._session as session, session.begin():
+            user = session.get(User, user_id)
 
-                activity = Activity(
-                    user_id=self._owner.id, summary=f'User {user.username} \
-                    deleted by {self._owner.username}', created=datetime.now()
-                )
-
-                session.delete(user)
-                session.add(activity)
+            if not user:
+                raise ValueError('User not found.')
 
-            except Exception as e:
-                session.rollback()
-                raise e
+            summary = f'User {user.username} deleted by {owner_username}'
+            session.delete(user)
+            session.execute(insert(Activity).values(
+                user_id=owner_id, summary=summary, created=datetime.now()
+            ))
 
-            else:
-                session.commit()
-                return True
+        return True
 
     def get_user_by_id(self, user_id: int) -> Type[User] | None:
         """Get a user by id
@@ -493,13 +495,8 @@ class UserController(BaseController):
             The user
         """
 
-        with self._session as session:
-            user = session.query(User).filter(User.id == user_id).first()
-
-            if user:
-                return user
-
-            return None
+        with self._readonly_session() as session:
+            return session.get(User, user_id)
 
     def get_user_by_uuid(self, user_uuid: str) -> Type[User] | None:
         """Get a user by uuid
@@ -515,7 +512,7 @@ class UserController(BaseController):
             The user
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             user = session.query(User).filter(User.uuid == user_uuid).first()
 
             if user:
@@ -537,7 +534,7 @@ class UserController(BaseController):
             The user
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             user = session.query(User).filter(User.username == username).first()
 
             if user:
@@ -559,7 +556,7 @@ class UserController(BaseController):
             The user
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             user = session.query(User).filter(User.email == email).first()
 
             if user:
@@ -576,21 +573,58 @@ class UserController(BaseController):
             The number of users
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(func.count(User.id)).scalar()
 
+    def estimate_user_count(self) -> int:
+        """Estimate the total number of users in the database
+
+        Returns
+        -------
+        int
+            The approximate number of users
+        """
+
+        with self._readonly_session() as session:
+            return self._estimate_row_count(session, User)
+
     def get_all_users(self) -> List[Type[User]]:
         """Get all users
 
+        Callers that only iterate over the users once should prefer
+        iter_all_users(), which does not hold the whole table in memory.
+
         Returns
         -------
         list
             A list of users
         """
 
-        with self._session as session:
+        with self._readonly_session() as session:
             return session.query(User).all()
 
+    def iter_all_users(self, batch_size: int = 1000) -> Iterator[User]:
+        """Get all users, streaming the results batch_size rows at a time
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of rows fetched per round trip
+
+        Returns
+        -------
+        Iterator
+            An iterator of user objects
+        """
+
+        with self._private_session() as session:
+            stmt = select(User).order_by(User.id).options(
+                selectinload(User.authors)
+            ).execution_options(yield_per=batch_size)
+
+            for user in session.scalars(stmt):
+                yield user
+
     def get_all_users_page(self, page: int, per_page: int) -> List[Type[User]]:
         """Get a single page of users from the database
 
@@ -604,16 +638,82 @@ class UserController(BaseController):
         Returns
         -------
         list
-            A list of users
+            A list of users sorted by id
         """
 
-        with self._session as session:
+        if page == 1:
+            return self.get_users_page_after(None, per_page)
+
+        with self._readonly_session() as session:
             offset = (page - 1) * per_page
-            return session.query(User).offset(offset).limit(per_page).all()
+            return session.query(User).order_by(
+                User.id
+            ).offset(offset).limit(per_page).all()
+
+    def get_users_page_after(
+        self, after_id: int | None, per_page: int
+    ) -> List[Type[User]]:
+        """Get the page of users that follows the given user id
+
+        Pages are sought on the primary key rather than skipped with OFFSET,
+        so fetching a deep page costs the same as fetching the first one.
+        Pass the id of the last user of the previous page, or None for the
+        first page.
+
+        Parameters
+        ----------
+        after_id : int | None
+            The id of the last user on the previous page
+        per_page : int
+            The number of rows per page
+
+        Returns
+        -------
+        list
+            A list of users sorted by id
+        """
+
+        with self._readonly_session() as session:
+            query = session.query(User)
+
+            if after_id is not None:
+                query = query.filter(User.id > after_id)
+
+            return query.order_by(User.id).limit(per_page).all()
+
+    def search_users_by_prefix(self, prefix: str) -> List[Type[User]]:
+        """Search for users whose username or email starts with a prefix
+
+        The anchored LIKE is served by the text_pattern_ops B-tree indexes on
+        PostgreSQL. Use search_users() to match anywhere in the value.
+
+        Parameters
+        ----------
+        prefix : str
+            The start of the username or email
+
+        Returns
+        -------
+        list
+            A list of users
+        """
+
+        pattern = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+        with self._readonly_session() as session:
+            return session.query(User).filter(
+                or_(
+                    User.username.like(pattern, escape='\\'),
+                    User.email.like(pattern, escape='\\')
+                )
+            ).all()
 
     def search_users(self, search: str) -> List[Type[User]]:
         """Search for users by username or email
 
+        The search matches any part of the username or email. On PostgreSQL the
+        LIKE patterns are served by trigram GIN indexes on both columns.
+
         Parameters
         ----------
         search : str
@@ -625,7 +725,9 @@ class UserController(BaseController):
             A list of users
         """
 
-        with self._session as session:
+        pattern = f'%{search}%'
+
+        with self._readonly_session() as session:
             return session.query(User).filter(
-                User.username.like(f'%{search}%') | User.email.like(f'%{search}%')
+                or_(User.username.like(pattern), User.email.like(pattern))
             ).all()
@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, DateTime, ForeignKey
+from sqlalchemy import Integer, String, DateTime, ForeignKey, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from gnatwriter.models import User, Base
+from gnatwriter.models import User, Base, format_datetime, assign_present
 
 
 class Activity(Base):
@@ -35,12 +35,19 @@ class Activity(Base):
     """
 
     __tablename__ = 'activities'
+    __table_args__ = (
+        # MySQL and PostgreSQL enforce VARCHAR lengths themselves, SQLite does
+        # not, and Core inserts bypass validate_summary()
+        CheckConstraint(
+            "length(summary) <= 250", name="ck_activities_summary_length"
+        ).ddl_if(dialect="sqlite"),
+    )
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, autoincrement=True
     )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     summary: Mapped[str] = mapped_column(String(250), nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship(
         "User", back_populates="activities"
     )
@@ -80,7 +87,7 @@ class Activity(Base):
             'id': self.id,
             'user_id': self.user_id,
             'summary': self.summary,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
         }
 
     def unserialize(self, data: dict) -> "Activity":
@@ -97,10 +104,7 @@ class Activity(Base):
             The updated activity
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.summary = data.get('summary', self.summary)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('id', 'user_id', 'summary', 'created'))
 
         return self
 
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import Integer, ForeignKey, Boolean, String, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from gnatwriter.models import User, AuthorStory, Base
+from gnatwriter.models import User, AuthorStory, Base, format_datetime, assign_present
 
 
 class Author(Base):
@@ -51,14 +51,14 @@ class Author(Base):
     is_pseudonym: Mapped[bool] = mapped_column(Boolean, default=False)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     initials: Mapped[str] = mapped_column(String(10), nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     user: Mapped["User"] = relationship("User", back_populates="authors")
     stories: Mapped[Optional[List["AuthorStory"]]] = relationship(
         "AuthorStory", back_populates="author",
-        cascade="all, delete, delete-orphan", lazy="joined")
+        cascade="all, delete, delete-orphan", lazy="selectin")
 
     def __repr__(self):
         """Returns a string representation of the author.
@@ -97,8 +97,8 @@ class Author(Base):
             'is_pseudonym': self.is_pseudonym,
             'name': self.name,
             'initials': self.initials,
-            'created': str(self.created),
-            'modified': str(self.modified),
+            'created': format_datetime(self.created),
+            'modified': format_datetime(self.modified),
         }
 
     def unserialize(self, data: dict) -> "Author":
@@ -110,13 +110,10 @@ class Author(Base):
             The updated author
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.is_pseudonym = data.get('is_pseudonym', self.is_pseudonym)
-        self.name = data.get('name', self.name)
-        self.initials = data.get('initials', self.initials)
-        self.created = data.get('created', self.created)
-        self.modified = data.get('modified', self.modified)
+        assign_present(self, data, (
+            'id', 'user_id', 'is_pseudonym', 'name', 'initials', 'created',
+            'modified'
+        ))
 
         return self
 
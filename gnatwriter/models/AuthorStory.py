@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Integer, ForeignKey, DateTime
+from sqlalchemy import Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Author, Story, Base
+from gnatwriter.models import User, Author, Story, Base, format_datetime, assign_present, relationships_loaded
 
 
 class AuthorStory(Base):
@@ -37,10 +37,13 @@ class AuthorStory(Base):
     """
 
     __tablename__ = 'authors_stories'
+    __table_args__ = (
+        Index("ix_authors_stories_user_story", "user_id", "story_id"),
+    )
     author_id: Mapped[int] = mapped_column(Integer, ForeignKey('authors.id'), primary_key=True)
     story_id: Mapped[int] = mapped_column(Integer, ForeignKey('stories.id'), primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     author: Mapped["Author"] = relationship(
         "Author", back_populates="stories", lazy="joined"
@@ -58,6 +61,9 @@ class AuthorStory(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "author", "story"):
+            return f'<AuthorStory author_id={self.author_id} story_id={self.story_id}>'
+
         return f'<AuthorStory {self.author.name!r} - {self.story.title!r}>'
 
     def __str__(self):
@@ -84,7 +90,7 @@ class AuthorStory(Base):
             'author_id': self.author_id,
             'story_id': self.story_id,
             'user_id': self.user_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
         }
 
     def unserialize(self, data: dict) -> "AuthorStory":
@@ -96,9 +102,6 @@ class AuthorStory(Base):
             The updated relationship
         """
 
-        self.author_id = data.get('author_id', self.author_id)
-        self.story_id = data.get('story_id', self.story_id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('author_id', 'story_id', 'user_id', 'created'))
 
         return self
@@ -1,3 +1,55 @@
+import os
+from datetime import datetime
+from sqlalchemy import inspect
 from sqlalchemy.orm import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+# Loader strategy for relationships that are not eagerly loaded. Setting the
+# GNATWRITER_RAISE_ON_LAZY_LOAD environment variable during development or
+# testing makes any implicit lazy load raise instead of silently emitting an
+# extra SELECT, so N+1 query patterns surface immediately.
+LAZY_LOAD_STRATEGY = (
+    "raise_on_sql" if os.environ.get("GNATWRITER_RAISE_ON_LAZY_LOAD") else "select"
+)
+
+
+def format_datetime(value: datetime | str | None) -> str | None:
+    """Format a datetime column value for serialize()
+
+    The result has the same yyyy-mm-dd hh:mm:ss[.ffffff] shape as str() of a
+    datetime, but a NULL value stays None instead of becoming "None". A value
+    that is still the string it was assigned as, on an instance that has not
+    been flushed, is returned as it is.
+    """
+
+    if value is None or isinstance(value, str):
+        return value
+
+    return value.isoformat(sep=" ")
+
+
+def assign_present(instance: object, data: dict, keys: tuple) -> None:
+    """Assign the values of the given keys that are present in data
+
+    Used by unserialize(). Keys missing from data are skipped instead of
+    being read back from the instance and assigned again, which would run
+    the attribute's validators a second time on a value that was already
+    validated.
+    """
+
+    for key in keys:
+        if key in data:
+            setattr(instance, key, data[key])
+
+
+def relationships_loaded(instance: object, *names: str) -> bool:
+    """Return whether all the named relationships are already loaded
+
+    Used by __repr__() to fall back to the foreign keys instead of loading
+    the related rows, so repr() of a row never queries the database.
+    """
+
+    unloaded = inspect(instance).unloaded
+
+    return not any(name in unloaded for name in names)
@@ -1,9 +1,8 @@
-from configparser import ConfigParser
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
-from sqlalchemy import Integer, ForeignKey, String, Date, DateTime
+from sqlalchemy import Integer, ForeignKey, String, Date, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from gnatwriter.models import User, Story, BibliographyAuthor, Base
+from gnatwriter.models import User, Story, BibliographyAuthor, Base, format_datetime, assign_present
 
 
 class Bibliography(Base):
@@ -23,7 +22,7 @@ class Bibliography(Base):
             The pertinent pages of the referenced work
         publisher: str
             The referenced work's publisher
-        publication_date: str
+        publication_date: date
             The referenced work's publication date in date form: yyy-mm-dd
         editor: str
             The referenced work's editor
@@ -52,28 +51,31 @@ class Bibliography(Base):
             Validates the title's length
         validate_pages(pages: str)
             Validates the pages' length
-        validate_publication_date(publication_date: str)
+        validate_publication_date(publication_date: str | date)
             Validates the publication date's format
     """
 
     __tablename__ = 'bibliographies'
+    __table_args__ = (
+        Index("ix_bibliographies_user_story", "user_id", "story_id"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     story_id: Mapped[int] = mapped_column(Integer, ForeignKey('stories.id'))
     title: Mapped[str] = mapped_column(String(250), nullable=True)
     pages: Mapped[str] = mapped_column(String(50), nullable=True)
     publisher: Mapped[str] = mapped_column(String(100), nullable=True)
-    publication_date: Mapped[str] = mapped_column(Date, nullable=True)
+    publication_date: Mapped[date] = mapped_column(Date, nullable=True)
     editor: Mapped[str] = mapped_column(String(100), nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     user: Mapped["User"] = relationship("User")
     story: Mapped["Story"] = relationship("Story", back_populates="references")
     authors: Mapped[Optional[List["BibliographyAuthor"]]] = relationship(
         "BibliographyAuthor", back_populates="reference",
-        lazy="joined", cascade="all, delete, delete-orphan"
+        lazy="selectin", cascade="all, delete, delete-orphan"
     )
 
     def __repr__(self):
@@ -113,9 +115,12 @@ class Bibliography(Base):
             'story_id': self.story_id,
             'title': self.title,
             'pages': self.pages,
-            'publication_date': str(self.publication_date),
-            'created': str(self.created),
-            'modified': str(self.modified),
+            'publication_date': (
+                self.publication_date.isoformat()
+                if self.publication_date is not None else None
+            ),
+            'created': format_datetime(self.created),
+            'modified': format_datetime(self.modified),
         }
 
     def unserialize(self, data: dict) -> "Bibliography":
@@ -128,14 +133,10 @@ class Bibliography(Base):
             The updated reference
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.story_id = data.get('story_id', self.story_id)
-        self.title = data.get('title', self.title)
-        self.pages = data.get('pages', self.pages)
-        self.publication_date = data.get('publication_date', self.publication_date)
-        self.created = data.get('created', self.created)
-        self.modified = data.get('modified', self.modified)
+        assign_present(self, data, (
+            'id', 'user_id', 'story_id', 'title', 'pages', 'publication_date',
+            'created', 'modified'
+        ))
 
         return self
 
@@ -193,24 +194,31 @@ class Bibliography(Base):
         return publisher
 
     @validates("publication_date")
-    def validate_publication_date(self, key, publication_date: str) -> str | None:
+    def validate_publication_date(
+        self, key, publication_date: str | date | None
+    ) -> date | None:
         """Validates the publication date's format.
 
+        Parameters
+        ----------
+        publication_date: str | date | None
+            The reference's publication date, as a date or in the format
+            YYYY-MM-DD
+
         Returns
         -------
-        str
+        date
             The validated publication date
         """
 
-        config = ConfigParser()
-        config.read("config.cfg")
-        date_format = config.get("formats", "date")
+        if publication_date is None or isinstance(publication_date, date):
+            return publication_date
 
-        if publication_date is not None and bool(datetime.strptime(publication_date, date_format)) is False:
+        try:
+            return date.fromisoformat(publication_date)
+        except (TypeError, ValueError):
             raise ValueError("Reference publication date must be in the format 'YYYY-MM-DD'.")
 
-        return publication_date
-
     @validates("editor")
     def validate_editor(self, key, editor: str) -> str:
         """Validates the editor's length.
@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, String, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from gnatwriter.models import Bibliography, User, Base
+from gnatwriter.models import Bibliography, User, Base, format_datetime, assign_present
 
 
 class BibliographyAuthor(Base):
@@ -50,7 +50,7 @@ class BibliographyAuthor(Base):
     )
     name: Mapped[str] = mapped_column(String(150), nullable=False)
     initials: Mapped[str] = mapped_column(String(10), nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     reference: Mapped["Bibliography"] = relationship(
         "Bibliography", back_populates="authors"
@@ -93,7 +93,7 @@ class BibliographyAuthor(Base):
             'bibliography_id': self.bibliography_id,
             'name': self.name,
             'initials': self.initials,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
         }
 
     def unserialize(self, data: dict) -> "BibliographyAuthor":
@@ -110,12 +110,9 @@ class BibliographyAuthor(Base):
             The updated author
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.bibliography_id = data.get('bibliography_id', self.bibliography_id)
-        self.name = data.get('name', self.name)
-        self.initials = data.get('initials', self.initials)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, (
+            'id', 'user_id', 'bibliography_id', 'name', 'initials', 'created'
+        ))
 
         return self
 
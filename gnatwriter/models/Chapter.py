@@ -1,8 +1,8 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Integer, ForeignKey, String, Text, DateTime
+from sqlalchemy import Integer, ForeignKey, String, Text, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
-from gnatwriter.models import Scene, User, Story, ChapterLink, ChapterNote, Base
+from gnatwriter.models import Scene, User, Story, ChapterLink, ChapterNote, Base, format_datetime, assign_present
 
 
 class Chapter(Base):
@@ -52,26 +52,30 @@ class Chapter(Base):
     """
 
     __tablename__ = 'chapters'
+    # also serves the ORDER BY position of a story's chapters
+    __table_args__ = (
+        Index("ix_chapters_user_story_position", "user_id", "story_id", "position"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     story_id: Mapped[int] = mapped_column(Integer, ForeignKey('stories.id'))
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     title: Mapped[str] = mapped_column(String(250), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     scenes: Mapped[Optional[List["Scene"]]] = relationship(
-        "Scene", back_populates="chapter", lazy="joined",
+        "Scene", back_populates="chapter", lazy="selectin",
         cascade="all, delete, delete-orphan")
     user: Mapped["User"] = relationship("User")
     story: Mapped["Story"] = relationship("Story", back_populates="chapters")
     links: Mapped[Optional[List["ChapterLink"]]] = relationship(
-        "ChapterLink", back_populates="chapter", lazy="joined",
+        "ChapterLink", back_populates="chapter", lazy="selectin",
         cascade="all, delete, delete-orphan")
     notes: Mapped[Optional[List["ChapterNote"]]] = relationship(
-        "ChapterNote", back_populates="chapter", lazy="joined",
+        "ChapterNote", back_populates="chapter", lazy="selectin",
         cascade="all, delete, delete-orphan")
 
     def __repr__(self):
@@ -133,8 +137,8 @@ class Chapter(Base):
             'position': self.position,
             'title': escaped_title,
             'description': escaped_description,
-            'created': str(self.created),
-            'modified': str(self.modified),
+            'created': format_datetime(self.created),
+            'modified': format_datetime(self.modified),
             'links': links,
             'notes': notes,
             'scenes': scenes
@@ -154,14 +158,10 @@ class Chapter(Base):
             The updated chapter
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.story_id = data.get('story_id', self.story_id)
-        self.position = data.get('position', self.position)
-        self.title = data.get('title', self.title)
-        self.description = data.get('description', self.description)
-        self.created = data.get('created', self.created)
-        self.modified = data.get('modified', self.modified)
+        assign_present(self, data, (
+            'id', 'user_id', 'story_id', 'position', 'title', 'description',
+            'created', 'modified'
+        ))
 
         return self
 
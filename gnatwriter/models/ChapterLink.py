@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Story, Chapter, Link, Base
+from gnatwriter.models import User, Story, Chapter, Link, Base, format_datetime, assign_present, relationships_loaded
 
 
 class ChapterLink(Base):
@@ -47,16 +47,16 @@ class ChapterLink(Base):
         Integer, ForeignKey('chapters.id'), primary_key=True
     )
     link_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey('links.id'), primary_key=True
+        Integer, ForeignKey('links.id'), primary_key=True, index=True
     )
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     story: Mapped["Story"] = relationship("Story")
     chapter: Mapped["Chapter"] = relationship(
         "Chapter", back_populates="links"
     )
     link: Mapped["Link"] = relationship(
-        "Link", back_populates="chapters", lazy="joined"
+        "Link", back_populates="chapters", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -68,6 +68,9 @@ class ChapterLink(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "chapter", "link"):
+            return f'<ChapterLink chapter_id={self.chapter_id} link_id={self.link_id}>'
+
         return f'<ChapterLink {self.chapter.title!r} - {self.link.title!r}>'
 
     def __str__(self):
@@ -95,7 +98,7 @@ class ChapterLink(Base):
             'story_id': self.story_id,
             'chapter_id': self.chapter_id,
             'link_id': self.link_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
         }
 
     def unserialize(self, data: dict) -> "ChapterLink":
@@ -112,10 +115,6 @@ class ChapterLink(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.story_id = data.get('story_id', self.story_id)
-        self.chapter_id = data.get('chapter_id', self.chapter_id)
-        self.link_id = data.get('link_id', self.link_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('user_id', 'story_id', 'chapter_id', 'link_id', 'created'))
 
         return self
@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Story, Chapter, Note, Base
+from gnatwriter.models import User, Story, Chapter, Note, Base, format_datetime, assign_present, relationships_loaded
 
 
 class ChapterNote(Base):
@@ -47,16 +47,16 @@ class ChapterNote(Base):
         Integer, ForeignKey('chapters.id'), primary_key=True
     )
     note_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey('notes.id'), primary_key=True
+        Integer, ForeignKey('notes.id'), primary_key=True, index=True
     )
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     story: Mapped["Story"] = relationship("Story")
     chapter: Mapped["Chapter"] = relationship(
         "Chapter", back_populates="notes"
     )
     note: Mapped["Note"] = relationship(
-        "Note", back_populates="chapters", lazy="joined"
+        "Note", back_populates="chapters", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -68,7 +68,10 @@ class ChapterNote(Base):
             A string representation of the relationship
         """
 
-        return f'<ChapterNote {self.chapte.title!r} - {self.note.title!r}>'
+        if not relationships_loaded(self, "chapter", "note"):
+            return f'<ChapterNote chapter_id={self.chapter_id} note_id={self.note_id}>'
+
+        return f'<ChapterNote {self.chapter.title!r} - {self.note.title!r}>'
 
     def __str__(self):
         """Returns a string representation of the relationship.
@@ -95,7 +98,7 @@ class ChapterNote(Base):
             'story_id': self.story_id,
             'chapter_id': self.chapter_id,
             'note_id': self.note_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
         }
 
     def unserialize(self, data: dict) -> "ChapterNote":
@@ -112,10 +115,6 @@ class ChapterNote(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.story_id = data.get('story_id', self.story_id)
-        self.chapter_id = data.get('chapter_id', self.chapter_id)
-        self.note_id = data.get('note_id', self.note_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('user_id', 'story_id', 'chapter_id', 'note_id', 'created'))
 
         return self
@@ -1,10 +1,9 @@
-from configparser import ConfigParser
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
 from sqlalchemy import Integer, ForeignKey, String, Date, Text, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from gnatwriter.models import User, CharacterRelationship, CharacterEvent, CharacterTrait, CharacterImage, CharacterLink, \
-    CharacterNote, CharacterStory, Base
+    CharacterNote, CharacterStory, Base, format_datetime, assign_present
 
 mbti_types = [
     "INTJ", "INTP", "ENTJ", "ENTP",
@@ -61,9 +60,9 @@ class Character(Base):
             The marital status of the character
         children: bool
             Whether the character has children
-        date_of_birth: str
+        date_of_birth: date
             The character's date of birth in date form: yyyy-mm-dd
-        date_of_death: str
+        date_of_death: date
             The character's date of death in date form: yyyy-mm-dd
         description: str
             The character's description
@@ -120,9 +119,9 @@ class Character(Base):
             Validates the length of the education value
         validate_marital_status(marital_status: str)
             Validates the length of the marital status value
-        validate_date_of_birth(date_of_birth: str)
+        validate_date_of_birth(date_of_birth: str | date)
             Validates the date of birth's format
-        validate_date_of_death(date_of_death: str)
+        validate_date_of_death(date_of_death: str | date)
             Validates the date of death's format
         validate_description(description: str)
             Validates the description's length
@@ -154,44 +153,44 @@ class Character(Base):
     education: Mapped[str] = mapped_column(Text, nullable=True)
     marital_status: Mapped[str] = mapped_column(String(50), nullable=True)
     children: Mapped[bool] = mapped_column(Integer, nullable=True)
-    date_of_birth: Mapped[str] = mapped_column(Date, nullable=True)
-    date_of_death: Mapped[str] = mapped_column(Date, nullable=True)
+    date_of_birth: Mapped[date] = mapped_column(Date, nullable=True)
+    date_of_death: Mapped[date] = mapped_column(Date, nullable=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     mbti: Mapped[str] = mapped_column(String(50), nullable=True)
     enneagram: Mapped[str] = mapped_column(String(50), nullable=True)
     wounds: Mapped[str] = mapped_column(Text, nullable=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     user: Mapped["User"] = relationship("User", back_populates="characters")
     character_relationships: Mapped[Optional[List["CharacterRelationship"]]] = relationship(
         "CharacterRelationship", back_populates="related_character",
-        foreign_keys="[CharacterRelationship.related_id]", lazy="joined",
+        foreign_keys="[CharacterRelationship.related_id]", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
     traits: Mapped[Optional[List["CharacterTrait"]]] = relationship(
-        "CharacterTrait", back_populates="character", lazy="joined",
+        "CharacterTrait", back_populates="character", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
     events: Mapped[Optional[List["CharacterEvent"]]] = relationship(
         "CharacterEvent", back_populates="character",
-        cascade="all, delete, delete-orphan", lazy="joined"
+        cascade="all, delete, delete-orphan", lazy="selectin"
     )
     images: Mapped[Optional[List["CharacterImage"]]] = relationship(
-        "CharacterImage", back_populates="character", lazy="joined",
+        "CharacterImage", back_populates="character", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
     links: Mapped[Optional[List["CharacterLink"]]] = relationship(
-        "CharacterLink", back_populates="character", lazy="joined",
+        "CharacterLink", back_populates="character", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
     notes: Mapped[Optional[List["CharacterNote"]]] = relationship(
-        "CharacterNote", back_populates="character", lazy="joined",
+        "CharacterNote", back_populates="character", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
     stories: Mapped[Optional[List["CharacterStory"]]] = relationship(
-        "CharacterStory", back_populates="character", lazy="joined",
+        "CharacterStory", back_populates="character", lazy="selectin",
         cascade="all, delete, delete-orphan"
     )
 
@@ -215,13 +214,16 @@ class Character(Base):
             A string representation of the character
         """
 
-        title = f'{self.title}' if self.title else ""
-        first_name = f' {self.first_name}' if self.first_name else ""
-        middle_name = f' {self.middle_name}' if self.middle_name else ""
-        last_name = f' {self.last_name}' if self.last_name else ""
-        nickname = f' ({self.nickname})' if self.nickname else ""
+        names = [
+            name for name in (
+                self.title, self.first_name, self.middle_name, self.last_name
+            ) if name
+        ]
 
-        return f'{title}{first_name}{middle_name}{last_name}{nickname}'
+        if self.nickname:
+            names.append(f'({self.nickname})')
+
+        return " ".join(names)
 
     def serialize(self) -> dict:
         """Returns a dictionary representation of the character.
@@ -296,14 +298,20 @@ class Character(Base):
             'marital_status': self.marital_status,
             'children': self.children,
             'age': self.age,
-            'date_of_birth': str(self.date_of_birth),
-            'date_of_death': str(self.date_of_death),
+            'date_of_birth': (
+                self.date_of_birth.isoformat()
+                if self.date_of_birth is not None else None
+            ),
+            'date_of_death': (
+                self.date_of_death.isoformat()
+                if self.date_of_death is not None else None
+            ),
             'description' : self.description,
             'mbti': self.mbti,
             'enneagram': self.enneagram,
             'wounds': self.wounds,
-            'created': str(self.created),
-            'modified': str(self.modified),
+            'created': format_datetime(self.created),
+            'modified': format_datetime(self.modified),
             'relationships': relationships,
             'traits': traits,
             'events': events,
@@ -322,31 +330,14 @@ class Character(Base):
             The updated character
         """
 
-        self.id = data.get('id', self.id)
-        self.user_id = data.get('user_id', self.user_id)
-        self.title = data.get('title', self.title)
-        self.honorific = data.get('honorific', self.honorific)
-        self.first_name = data.get('first_name', self.first_name)
-        self.middle_name = data.get('middle_name', self.middle_name)
-        self.last_name = data.get('last_name', self.last_name)
-        self.nickname = data.get('nickname', self.nickname)
-        self.gender = data.get('gender', self.gender)
-        self.sex = data.get('sex', self.sex)
-        self.ethnicity = data.get('ethnicity', self.ethnicity)
-        self.nationality = data.get('nationality', self.nationality)
-        self.religion = data.get('religion', self.religion)
-        self.occupation = data.get('occupation', self.occupation)
-        self.education = data.get('education', self.education)
-        self.marital_status = data.get('marital_status', self.marital_status)
-        self.children = data.get('children', self.children)
-        self.date_of_birth = data.get('date_of_birth', self.date_of_birth)
-        self.date_of_death = data.get('date_of_death', self.date_of_death)
-        self.description = data.get('description', self.description)
-        self.mbti = data.get('mbti', self.mbti)
-        self.enneagram = data.get('enneagram', self.enneagram)
-        self.wounds = data.get('wounds', self.wounds)
-        self.created = data.get('created', self.created)
-        self.modified = data.get('modified', self.modified)
+        assign_present(self, data, (
+            'id', 'user_id', 'title', 'honorific', 'first_name', 'middle_name',
+            'last_name', 'nickname', 'gender', 'sex', 'ethnicity',
+            'nationality', 'religion', 'occupation', 'education',
+            'marital_status', 'children', 'date_of_birth', 'date_of_death',
+            'description', 'mbti', 'enneagram', 'wounds', 'created',
+            'modified'
+        ))
 
         return self
 
@@ -670,6 +661,58 @@ class Character(Base):
 
         return marital_status
 
+    @validates("date_of_birth")
+    def validate_date_of_birth(
+        self, key, date_of_birth: str | date | None
+    ) -> date | None:
+        """Validates the date of birth's format.
+
+        Parameters
+        ----------
+        date_of_birth: str | date | None
+            The character's date of birth, as a date or in the format
+            YYYY-MM-DD
+
+        Returns
+        -------
+        date
+            The validated date of birth
+        """
+
+        if not date_of_birth or isinstance(date_of_birth, date):
+            return date_of_birth or None
+
+        try:
+            return date.fromisoformat(date_of_birth)
+        except (TypeError, ValueError):
+            raise ValueError("The date of birth must be in the format 'YYYY-MM-DD'.")
+
+    @validates("date_of_death")
+    def validate_date_of_death(
+        self, key, date_of_death: str | date | None
+    ) -> date | None:
+        """Validates the date of death's format.
+
+        Parameters
+        ----------
+        date_of_death: str | date | None
+            The character's date of death, as a date or in the format
+            YYYY-MM-DD
+
+        Returns
+        -------
+        date
+            The validated date of death
+        """
+
+        if not date_of_death or isinstance(date_of_death, date):
+            return date_of_death or None
+
+        try:
+            return date.fromisoformat(date_of_death)
+        except (TypeError, ValueError):
+            raise ValueError("The date of death must be in the format 'YYYY-MM-DD'.")
+
     @validates("description")
     def validate_description(self, key, description: str) -> str:
         """Validates the description's length.
@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Character, Event, Base
+from gnatwriter.models import User, Character, Event, Base, format_datetime, assign_present, relationships_loaded
 
 
 class CharacterEvent(Base):
@@ -39,12 +39,14 @@ class CharacterEvent(Base):
     __tablename__ = 'characters_events'
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     character_id: Mapped[int] = mapped_column(Integer, ForeignKey('characters.id'), primary_key=True)
-    event_id: Mapped[int] = mapped_column(Integer, ForeignKey('events.id'), primary_key=True)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    event_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey('events.id'), primary_key=True, index=True
+    )
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     character: Mapped["Character"] = relationship("Character", back_populates="events")
     event: Mapped["Event"] = relationship(
-        "Event", back_populates="characters", lazy='joined'
+        "Event", back_populates="characters", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -56,6 +58,9 @@ class CharacterEvent(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "character", "event"):
+            return f'<CharacterEvent character_id={self.character_id} event_id={self.event_id}>'
+
         return f'<CharacterEvent {self.character.first_name!r} {self.character.last_name!r} - {self.event.title!r}>'
 
     def __str__(self):
@@ -82,7 +87,7 @@ class CharacterEvent(Base):
             'user_id': self.user_id,
             'character_id': self.character_id,
             'event_id': self.event_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
             'event': self.event.title,
         }
 
@@ -100,9 +105,6 @@ class CharacterEvent(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.character_id = data.get('character_id', self.character_id)
-        self.event_id = data.get('event_id', self.event_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('user_id', 'character_id', 'event_id', 'created'))
 
         return self
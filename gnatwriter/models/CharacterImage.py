@@ -1,7 +1,7 @@
 from datetime import datetime
-from sqlalchemy import Integer, ForeignKey, Boolean, DateTime
+from sqlalchemy import Integer, ForeignKey, Boolean, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Image, Base, Character
+from gnatwriter.models import User, Image, Base, format_datetime, assign_present, relationships_loaded, Character
 
 
 class CharacterImage(Base):
@@ -42,25 +42,37 @@ class CharacterImage(Base):
             Updates the relationship's attributes with the values from the dictionary
     """
     __tablename__ = 'characters_images'
+    __table_args__ = (
+        # serves the position lookups and ordering of a character's images
+        Index("ix_characters_images_character_position", "character_id", "position"),
+        # a character has at most one default image, and looking it up reads
+        # a single entry of this partial index; MySQL has no partial indexes,
+        # so there the controller alone keeps a single default
+        Index(
+            "ix_characters_images_character_default", "character_id",
+            unique=True, sqlite_where=text("is_default = 1"),
+            postgresql_where=text("is_default = true")
+        ).ddl_if(dialect=("sqlite", "postgresql")),
+    )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     character_id: Mapped[int] = mapped_column(
         Integer, ForeignKey('characters.id'), primary_key=True
     )
     image_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey('images.id'), primary_key=True
+        Integer, ForeignKey('images.id'), primary_key=True, index=True
     )
     position: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     is_default: Mapped[bool] = mapped_column(Boolean, default=False)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now
     )
     user: Mapped["User"] = relationship("User")
     character: Mapped["Character"] = relationship(
         "Character", back_populates="images"
     )
     image: Mapped["Image"] = relationship(
-        "Image", back_populates="character", lazy="joined"
+        "Image", back_populates="character", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -72,6 +84,9 @@ class CharacterImage(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "character", "image"):
+            return f'<CharacterImage character_id={self.character_id} image_id={self.image_id}>'
+
         return f'<CharacterImage {self.character.first_name!r} {self.character.last_name!r} - {self.image.caption!r}>'
 
     def __str__(self):
@@ -100,8 +115,8 @@ class CharacterImage(Base):
             'image_id': self.image_id,
             'position': self.position,
             'is_default': self.is_default,
-            'created': str(self.created),
-            'modified': str(self.modified),
+            'created': format_datetime(self.created),
+            'modified': format_datetime(self.modified),
             'image': self.image.serialize()
         }
 
@@ -119,12 +134,9 @@ class CharacterImage(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.character_id = data.get('character_id', self.character_id)
-        self.image_id = data.get('image_id', self.image_id)
-        self.position = data.get('position', self.position)
-        self.is_default = data.get('is_default', self.is_default)
-        self.created = data.get('created', self.created)
-        self.modified = data.get('modified', self.modified)
+        assign_present(self, data, (
+            'user_id', 'character_id', 'image_id', 'position', 'is_default',
+            'created', 'modified'
+        ))
 
         return self
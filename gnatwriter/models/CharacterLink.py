@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Character, Link, Base
+from gnatwriter.models import User, Character, Link, Base, format_datetime, assign_present, relationships_loaded
 
 
 class CharacterLink(Base):
@@ -42,15 +42,15 @@ class CharacterLink(Base):
         Integer, ForeignKey('characters.id'), primary_key=True
     )
     link_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey('links.id'), primary_key=True
+        Integer, ForeignKey('links.id'), primary_key=True, index=True
     )
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     character: Mapped["Character"] = relationship(
         "Character", back_populates="links"
     )
     link: Mapped["Link"] = relationship(
-        "Link", back_populates="characters", lazy='joined'
+        "Link", back_populates="characters", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -62,6 +62,9 @@ class CharacterLink(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "character", "link"):
+            return f'<CharacterLink character_id={self.character_id} link_id={self.link_id}>'
+
         return f'<CharacterLink {self.character.first_name!r} {self.character.last_name!r} - {self.link.title!r}>'
 
     def __str__(self):
@@ -88,7 +91,7 @@ class CharacterLink(Base):
             'user_id': self.user_id,
             'character_id': self.character_id,
             'link_id': self.link_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
             'link': self.link.serialize()
         }
 
@@ -101,9 +104,6 @@ class CharacterLink(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.character_id = data.get('character_id', self.character_id)
-        self.link_id = data.get('link_id', self.link_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('user_id', 'character_id', 'link_id', 'created'))
 
         return self
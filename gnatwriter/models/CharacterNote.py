@@ -1,7 +1,7 @@
 from datetime import datetime
 from sqlalchemy import Integer, ForeignKey, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from gnatwriter.models import User, Character, Note, Base
+from gnatwriter.models import User, Character, Note, Base, format_datetime, assign_present, relationships_loaded
 
 
 class CharacterNote(Base):
@@ -42,15 +42,15 @@ class CharacterNote(Base):
         Integer, ForeignKey('characters.id'), primary_key=True
     )
     note_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey('notes.id'), primary_key=True
+        Integer, ForeignKey('notes.id'), primary_key=True, index=True
     )
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     user: Mapped["User"] = relationship("User")
     character: Mapped["Character"] = relationship(
         "Character", back_populates="notes"
     )
     note: Mapped["Note"] = relationship(
-        "Note", back_populates="characters", lazy='joined'
+        "Note", back_populates="characters", lazy="joined", innerjoin=True
     )
 
     def __repr__(self):
@@ -62,6 +62,9 @@ class CharacterNote(Base):
             A string representation of the relationship
         """
 
+        if not relationships_loaded(self, "character", "note"):
+            return f'<CharacterNote character_id={self.character_id} note_id={self.note_id}>'
+
         return f'<CharacterNote {self.character.first_name!r} {self.character.last_name!r} - {self.note.title!r}>'
 
     def __str__(self):
@@ -88,7 +91,7 @@ class CharacterNote(Base):
             'user_id': self.user_id,
             'character_id': self.character_id,
             'note_id': self.note_id,
-            'created': str(self.created),
+            'created': format_datetime(self.created),
             'note': self.note.serialize()
         }
 
@@ -106,9 +109,6 @@ class CharacterNote(Base):
             The updated relationship
         """
 
-        self.user_id = data.get('user_id', self.user_id)
-        self.character_id = data.get('character_id', self.character_id)
-        self.note_id = data.get('note_id', self.note_id)
-        self.created = data.get('created', self.created)
+        assign_present(self, data, ('user_id', 'character_id', 'note_id', 'created'))
 
         return self
@@ -70,13 +70,13 @@ class Event(Base):
         "User", back_populates="events"
     )
     links: Mapped[Optional[List["EventLink"]]] = relationship(
-        "EventLink", back_populates="event", lazy="joined",
+        "EventLink", back_populates="event", lazy="selectin",
         cascade="all, delete, delete-orphan")
     characters: Mapped[Optional[List["CharacterEvent"]]] = relationship(
-        "CharacterEvent", back_populates="event", lazy="joined",
+        "CharacterEvent", back_populates="event", lazy="selectin",
         cascade="all, delete, delete-orphan")
     notes: Mapped[Optional[List["EventNote"]]] = relationship(
-        "EventNote", back_populates="event", lazy="joined",
+        "EventNote", back_populates="event", lazy="selectin",
         cascade="all, delete, delete-orphan")
 
     def __repr__(self):
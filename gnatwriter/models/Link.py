@@ -3,7 +3,6 @@ from typing import Optional, List
 from sqlalchemy import Integer, ForeignKey, String, DateTime
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from gnatwriter.models import User, LinkStory, ChapterLink, LinkScene, CharacterLink, EventLink, LinkLocation, Base
-from validators import url as url_validator
 
 
 class Link(Base):
@@ -192,6 +191,10 @@ class Link(Base):
         if len(url) > 200:
             raise ValueError("The link URL can have no more than 200 characters.")
 
+        # imported here so loading the models does not pay for the validators
+        # package, which is only needed when a link is created or changed
+        from validators import url as url_validator
+
         if not url_validator(url):
             raise ValueError("The link URL is not valid.")
 
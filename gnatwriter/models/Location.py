@@ -97,10 +97,10 @@ class Location(Base):
         cascade="all, delete, delete-orphan")
     links: Mapped[Optional[List["LinkLocation"]]] = relationship(
         "LinkLocation", back_populates="location",
-        cascade="all, delete, delete-orphan", lazy="joined")
+        cascade="all, delete, delete-orphan", lazy="selectin")
     notes: Mapped[Optional[List["LocationNote"]]] = relationship(
         "LocationNote", back_populates="location",
-        cascade="all, delete, delete-orphan", lazy="joined")
+        cascade="all, delete, delete-orphan", lazy="selectin")
 
     def __repr__(self):
         """Returns a string representation of the location.
@@ -71,10 +71,10 @@ class Scene(Base):
     chapter: Mapped["Chapter"] = relationship("Chapter", back_populates="scenes")
     user: Mapped["User"] = relationship("User")
     links: Mapped[Optional[List["LinkScene"]]] = relationship(
-        "LinkScene", back_populates="scene", lazy="joined",
+        "LinkScene", back_populates="scene", lazy="selectin",
         cascade="all, delete, delete-orphan")
     notes: Mapped[Optional[List["NoteScene"]]] = relationship(
-        "NoteScene", back_populates="scene", lazy="joined",
+        "NoteScene", back_populates="scene", lazy="selectin",
         cascade="all, delete, delete-orphan")
 
     def __repr__(self):
@@ -1,11 +1,28 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Integer, ForeignKey, String, Text, DateTime
+from sqlalchemy import Integer, ForeignKey, String, Text, DateTime, DDL, event, Index, Connection, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from gnatwriter.models import User, Chapter, AuthorStory, Bibliography, Submission, LinkStory, NoteStory, CharacterStory, \
     Base
 
 
+# Triggers that keep the SQLite FTS5 table of story titles and descriptions in
+# step with the stories table; Story.create_search_index() installs them.
+_SQLITE_FTS_STATEMENTS = (
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_insert AFTER INSERT ON stories BEGIN "
+    "INSERT INTO stories_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_delete AFTER DELETE ON stories BEGIN "
+    "INSERT INTO stories_fts(stories_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS stories_fts_update AFTER UPDATE ON stories BEGIN "
+    "INSERT INTO stories_fts(stories_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); "
+    "INSERT INTO stories_fts(rowid, title, description) "
+    "VALUES (new.id, new.title, new.description); END",
+)
+
+
 class Story(Base):
     """The Story class represents a story in the application.
 
@@ -48,13 +65,22 @@ class Story(Base):
             Returns a dictionary representation of the story
         unserialize(data: dict)
             Updates the story's attributes with the values from the dictionary
+        check_title(title: str)
+            Checks the title's presence and length
+        check_description(description: str)
+            Checks the description's length
         validate_title(title: str)
             Validates the title's length
         validate_description(description: str)
             Validates the description's length
+        create_search_index(connection: Connection)
+            Creates the full-text index of the stories table if it is missing
     """
 
     __tablename__ = 'stories'
+    __table_args__ = (
+        Index("ix_stories_user_id_id", "user_id", "id"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     title: Mapped[str] = mapped_column(String(250), nullable=False)
@@ -65,22 +91,22 @@ class Story(Base):
     )
     user: Mapped["User"] = relationship("User", back_populates="stories")
     chapters: Mapped[Optional[List["Chapter"]]] = relationship(
-        "Chapter", back_populates="story", lazy="joined",
+        "Chapter", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     authors: Mapped[Optional[List["AuthorStory"]]] = relationship(
-        "AuthorStory", back_populates="story", lazy="joined",
+        "AuthorStory", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     references: Mapped[Optional[List["Bibliography"]]] = relationship(
-        "Bibliography", back_populates="story", lazy="joined",
+        "Bibliography", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     submissions: Mapped[Optional[List["Submission"]]] = relationship(
-        "Submission", back_populates="story", lazy="joined",
+        "Submission", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     links: Mapped[Optional[List["LinkStory"]]] = relationship(
-        "LinkStory", back_populates="story", lazy="joined",
+        "LinkStory", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     notes: Mapped[Optional[List["NoteStory"]]] = relationship(
-        "NoteStory", back_populates="story", lazy="joined",
+        "NoteStory", back_populates="story", lazy="selectin",
         cascade="all, delete, delete-orphan")
     characters: Mapped[Optional[List["CharacterStory"]]] = relationship(
         "CharacterStory", back_populates="story",
@@ -178,9 +204,11 @@ class Story(Base):
 
         return self
 
-    @validates("title")
-    def validate_title(self, key, title: str) -> str:
-        """Validates the title's length.
+    @staticmethod
+    def check_title(title: str) -> str:
+        """Checks the title's presence and length.
+
+        Used by the validator and by bulk inserts, which bypass it.
 
         Parameters
         ----------
@@ -190,8 +218,7 @@ class Story(Base):
         Returns
         -------
         str
-            The validated title
-            :param key:
+            The checked title
         """
 
         if not title:
@@ -202,6 +229,44 @@ class Story(Base):
 
         return title
 
+    @staticmethod
+    def check_description(description: str) -> str:
+        """Checks the description's length.
+
+        Parameters
+        ----------
+        description: str
+            The story's description
+
+        Returns
+        -------
+        str
+            The checked description
+        """
+
+        if description and len(description) > 65535:
+            raise ValueError("The story description can have no more than 65,535 characters.")
+
+        return description
+
+    @validates("title")
+    def validate_title(self, key, title: str) -> str:
+        """Validates the title's length.
+
+        Parameters
+        ----------
+        title: str
+            The story's title
+
+        Returns
+        -------
+        str
+            The validated title
+            :param key:
+        """
+
+        return self.check_title(title)
+
     @validates("description")
     def validate_description(self, key, description: str) -> str:
         """Validates the description's length.
@@ -217,7 +282,63 @@ class Story(Base):
             The validated description
         """
 
-        if description and len(description) > 65535:
-            raise ValueError("The story description can have no more than 65,535 characters.")
+        return self.check_description(description)
 
-        return description
+    @classmethod
+    def create_search_index(cls, connection: Connection) -> None:
+        """Create the full-text index of the stories table if it is missing
+
+        Call this after Base.metadata.create_all(). It is safe to run at every
+        startup, and it also covers databases whose stories table predates the
+        index: PostgreSQL and MySQL index the existing rows when the index is
+        built, and the SQLite FTS5 table is rebuilt from the stories table when
+        it is first created.
+
+        Parameters
+        ----------
+        connection : Connection
+            A connection in a transaction that is committed by the caller
+        """
+
+        dialect = connection.dialect.name
+
+        if dialect == "postgresql":
+            connection.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_stories_fulltext ON stories USING GIN "
+                "(to_tsvector('english', title || ' ' || coalesce(description, '')))"
+            ))
+
+        elif dialect == "mysql":
+            exists = connection.execute(text(
+                "SELECT COUNT(*) FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'stories' "
+                "AND index_name = 'ix_stories_fulltext'"
+            )).scalar()
+
+            if not exists:
+                connection.execute(text(
+                    "CREATE FULLTEXT INDEX ix_stories_fulltext ON stories (title, description)"
+                ))
+
+        elif dialect == "sqlite":
+            exists = connection.execute(text(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'stories_fts'"
+            )).scalar()
+
+            if not exists:
+                connection.execute(text(
+                    "CREATE VIRTUAL TABLE stories_fts USING fts5(title, description, "
+                    "content='stories', content_rowid='id')"
+                ))
+                connection.execute(text(
+                    "INSERT INTO stories_fts(stories_fts) VALUES ('rebuild')"
+                ))
+
+            for statement in _SQLITE_FTS_STATEMENTS:
+                connection.execute(text(statement))
+
+
+event.listen(
+    Story.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS stories_fts").execute_if(dialect="sqlite")
+)
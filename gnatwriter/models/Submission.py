@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Integer, ForeignKey, Text, Date, String, Float, DateTime
+from sqlalchemy import Integer, ForeignKey, Text, Date, String, Float, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from gnatwriter.models import SubmissionResultType, User, Story, Base
 
@@ -63,6 +63,9 @@ class Submission(Base):
     """
 
     __tablename__ = 'submissions'
+    __table_args__ = (
+        Index("ix_submissions_user_id_id", "user_id", "id"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id'))
     story_id: Mapped[int] = mapped_column(Integer, ForeignKey('stories.id'))
@@ -1,11 +1,9 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Integer, String, Boolean, DateTime
+from sqlalchemy import Integer, String, Boolean, DateTime, DDL, event, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from gnatwriter.models import Activity, Assistance, Author, Character, Event, Image, Link, Location, Note, Story, \
-    Submission, Base
-from validators import email as email_validator
-from validators import uuid as uuid_validator
+    Submission, Base, LAZY_LOAD_STRATEGY
 
 
 class User(Base):
@@ -73,49 +71,61 @@ class User(Base):
     """
 
     __tablename__ = 'users'
+    # B-tree indexes that anchored LIKE 'prefix%' searches can use on
+    # PostgreSQL regardless of the database collation
+    __table_args__ = (
+        Index(
+            "ix_users_username_pattern", "username",
+            postgresql_ops={"username": "text_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_email_pattern", "email",
+            postgresql_ops={"email": "text_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    uuid: Mapped[str] = mapped_column(String(36), nullable=False)
+    uuid: Mapped[str] = mapped_column(String(36), nullable=False, unique=True)
     username: Mapped[str] = mapped_column(String(50), nullable=False)
     email: Mapped[str] = mapped_column(String(100), nullable=False)
     password: Mapped[str] = mapped_column(String(250), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=False)
     is_banned: Mapped[bool] = mapped_column(Boolean, default=False)
-    created: Mapped[str] = mapped_column(DateTime, default=str(datetime.now()))
-    modified: Mapped[str] = mapped_column(
-        DateTime, default=str(datetime.now()), onupdate=str(datetime.now())
+    created: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    modified: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, index=True
     )
     activities: Mapped[Optional[List["Activity"]]] = relationship(
-        "Activity", back_populates="user",
+        "Activity", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     assistances: Mapped[Optional[List["Assistance"]]] = relationship(
-        "Assistance", back_populates="user",
+        "Assistance", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     authors: Mapped[Optional[List["Author"]]] = relationship(
-        "Author", back_populates="user", lazy="joined",
+        "Author", back_populates="user", lazy="selectin",
         cascade="all, delete, delete-orphan")
     characters: Mapped[Optional[List["Character"]]] = relationship(
-        "Character", back_populates="user",
+        "Character", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     events: Mapped[Optional[List["Event"]]] = relationship(
-        "Event", back_populates="user",
+        "Event", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     images: Mapped[Optional[List["Image"]]] = relationship(
-        "Image", back_populates="user",
+        "Image", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     links: Mapped[Optional[List["Link"]]] = relationship(
-        "Link", back_populates="user",
+        "Link", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     locations: Mapped[Optional[List["Location"]]] = relationship(
-        "Location", back_populates="user",
+        "Location", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     notes: Mapped[Optional[List["Note"]]] = relationship(
-        "Note", back_populates="user",
+        "Note", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     stories: Mapped[Optional[List["Story"]]] = relationship(
-        "Story", back_populates="user",
+        "Story", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
     submissions: Mapped[Optional[List["Submission"]]] = relationship(
-        "Submission", back_populates="user",
+        "Submission", back_populates="user", lazy=LAZY_LOAD_STRATEGY,
         cascade="all, delete, delete-orphan")
 
     def __repr__(self):
@@ -206,6 +216,10 @@ class User(Base):
         if len(uuid) != 36:
             raise ValueError("The user UUID must have 36 characters.")
 
+        # imported here so loading the models does not pay for the validators
+        # package, which is only needed when a user is created or changed
+        from validators import uuid as uuid_validator
+
         if not uuid_validator(uuid):
             raise ValueError("The user UUID is not valid.")
 
@@ -255,6 +269,8 @@ class User(Base):
         if len(email) > 100:
             raise ValueError("The email address can have no more than 100 characters.")
 
+        from validators import email as email_validator
+
         if not email_validator(email):
             raise ValueError("The email address is not valid.")
 
@@ -282,3 +298,20 @@ class User(Base):
             raise ValueError("The password can have no more than 250 characters.")
 
         return password
+
+
+# Trigram indexes let UserController.search_users() match substrings of the
+# username and email through an index on PostgreSQL instead of a table scan.
+event.listen(
+    User.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+for column in ("username", "email"):
+    event.listen(
+        User.__table__, "after_create",
+        DDL(
+            f"CREATE INDEX IF NOT EXISTS ix_users_{column}_trgm ON users "
+            f"USING gin ({column} gin_trgm_ops)"
+        ).execute_if(dialect="postgresql")
+    )
@@ -1,40 +1,86 @@
-from gnatwriter.models.Base import Base
-from gnatwriter.models.Activity import Activity
-from gnatwriter.models.Assistance import Assistance
-from gnatwriter.models.Author import Author
-from gnatwriter.models.AuthorStory import AuthorStory
-from gnatwriter.models.Bibliography import Bibliography
-from gnatwriter.models.BibliographyAuthor import BibliographyAuthor
-from gnatwriter.models.Chapter import Chapter
-from gnatwriter.models.ChapterLink import ChapterLink
-from gnatwriter.models.ChapterNote import ChapterNote
-from gnatwriter.models.Character import Character
-from gnatwriter.models.CharacterEvent import CharacterEvent
-from gnatwriter.models.CharacterImage import CharacterImage
-from gnatwriter.models.CharacterLink import CharacterLink
-from gnatwriter.models.CharacterNote import CharacterNote
-from gnatwriter.models.CharacterRelationship import CharacterRelationship
-from gnatwriter.models.CharacterRelationshipTypes import CharacterRelationshipTypes
-from gnatwriter.models.CharacterStory import CharacterStory
-from gnatwriter.models.CharacterTrait import CharacterTrait
-from gnatwriter.models.Event import Event
-from gnatwriter.models.EventLink import EventLink
-from gnatwriter.models.EventNote import EventNote
-from gnatwriter.models.Image import Image
-from gnatwriter.models.ImageLocation import ImageLocation
-from gnatwriter.models.ImageMimeTypes import ImageMimeTypes
-from gnatwriter.models.Link import Link
-from gnatwriter.models.LinkLocation import LinkLocation
-from gnatwriter.models.LinkScene import LinkScene
-from gnatwriter.models.LinkStory import LinkStory
-from gnatwriter.models.Location import Location
-from gnatwriter.models.LocationNote import LocationNote
-from gnatwriter.models.Note import Note
-from gnatwriter.models.NoteScene import NoteScene
-from gnatwriter.models.NoteStory import NoteStory
-from gnatwriter.models.OllamaModel import OllamaModel
-from gnatwriter.models.Scene import Scene
-from gnatwriter.models.Story import Story
-from gnatwriter.models.Submission import Submission
-from gnatwriter.models.SubmissionResultType import SubmissionResultType
-from gnatwriter.models.User import User
+"""SQLAlchemy models for GnatWriter
+
+Only Base is imported eagerly. Each model module is imported the first time
+its class is looked up on this package (PEP 562), so a caller that needs a
+handful of models does not pay for importing and mapping all of them. The
+models import their related models, so the mapper graph is complete by the
+time any of them is used in a query.
+"""
+import importlib
+from gnatwriter.models.Base import Base, LAZY_LOAD_STRATEGY, format_datetime, assign_present, \
+    relationships_loaded
+
+_MODEL_MAP = {
+    "Activity": "gnatwriter.models.Activity",
+    "Assistance": "gnatwriter.models.Assistance",
+    "Author": "gnatwriter.models.Author",
+    "AuthorStory": "gnatwriter.models.AuthorStory",
+    "Bibliography": "gnatwriter.models.Bibliography",
+    "BibliographyAuthor": "gnatwriter.models.BibliographyAuthor",
+    "Chapter": "gnatwriter.models.Chapter",
+    "ChapterLink": "gnatwriter.models.ChapterLink",
+    "ChapterNote": "gnatwriter.models.ChapterNote",
+    "Character": "gnatwriter.models.Character",
+    "CharacterEvent": "gnatwriter.models.CharacterEvent",
+    "CharacterImage": "gnatwriter.models.CharacterImage",
+    "CharacterLink": "gnatwriter.models.CharacterLink",
+    "CharacterNote": "gnatwriter.models.CharacterNote",
+    "CharacterRelationship": "gnatwriter.models.CharacterRelationship",
+    "CharacterRelationshipTypes": "gnatwriter.models.CharacterRelationshipTypes",
+    "CharacterStory": "gnatwriter.models.CharacterStory",
+    "CharacterTrait": "gnatwriter.models.CharacterTrait",
+    "Event": "gnatwriter.models.Event",
+    "EventLink": "gnatwriter.models.EventLink",
+    "EventNote": "gnatwriter.models.EventNote",
+    "Image": "gnatwriter.models.Image",
+    "ImageLocation": "gnatwriter.models.ImageLocation",
+    "ImageMimeTypes": "gnatwriter.models.ImageMimeTypes",
+    "Link": "gnatwriter.models.Link",
+    "LinkLocation": "gnatwriter.models.LinkLocation",
+    "LinkScene": "gnatwriter.models.LinkScene",
+    "LinkStory": "gnatwriter.models.LinkStory",
+    "Location": "gnatwriter.models.Location",
+    "LocationNote": "gnatwriter.models.LocationNote",
+    "Note": "gnatwriter.models.Note",
+    "NoteScene": "gnatwriter.models.NoteScene",
+    "NoteStory": "gnatwriter.models.NoteStory",
+    "OllamaModel": "gnatwriter.models.OllamaModel",
+    "Scene": "gnatwriter.models.Scene",
+    "Story": "gnatwriter.models.Story",
+    "Submission": "gnatwriter.models.Submission",
+    "SubmissionResultType": "gnatwriter.models.SubmissionResultType",
+    "User": "gnatwriter.models.User",
+}
+
+__all__ = ["Base", "LAZY_LOAD_STRATEGY", "format_datetime", "assign_present", "relationships_loaded",
+           "load_all_models", *_MODEL_MAP]
+
+
+def __getattr__(name: str):
+    """Import a model module on first access and cache its class"""
+
+    if name not in _MODEL_MAP:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_MODEL_MAP[name])
+    model = getattr(module, name)
+    # importing the submodule binds the module object to this name on the
+    # package, so the class has to be stored over it
+    globals()[name] = model
+
+    return model
+
+
+def load_all_models() -> None:
+    """Import every model so Base.metadata knows all the tables
+
+    Call this before Base.metadata.create_all(); tables whose models nobody
+    has looked up yet would otherwise be left out.
+    """
+
+    for name in _MODEL_MAP:
+        __getattr__(name)
+
+
+def __dir__():
+    return sorted(__all__)